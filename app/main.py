@@ -17,6 +17,8 @@ from .config import get_config, DEFAULT_WEIGHTS, DEFAULT_VIDEO
 from .api.router import router as api_router
 from .core.camera_manager import get_camera_manager
 from .core.event_processor import get_event_processor
+from .web.assets import STATIC_DIR, STATIC_URL, PRIVATE_IMMUTABLE_CACHE_CONTROL, ImmutableStaticFiles, asset_url
+from .web.pages import HTMLPage
 
 
 # Ensure directories exist
@@ -180,15 +182,118 @@ static_path = Path(__file__).parent.parent / "frontend" / "dist"
 if static_path.exists():
     app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
+# Precompiled Tailwind build shared with the web service (see tailwind/)
+ASSETS_URL = "/assets"
+app.mount(ASSETS_URL, ImmutableStaticFiles(directory=str(STATIC_DIR)), name="assets")
+TAILWIND_LINK = (
+    '<link rel="stylesheet" href="'
+    + ASSETS_URL + asset_url("tailwind.css").removeprefix(STATIC_URL)
+    + '">'
+)
+
+ICON_SPRITE_URL = ASSETS_URL + asset_url("icons.svg").removeprefix(STATIC_URL)
+
+
+def _icon(name: str, css: str) -> str:
+    """Reference an icon from the shared sprite, cached once per origin."""
+    return f'<svg class="{css}" fill="currentColor"><use href="{ICON_SPRITE_URL}#icon-{name}"/></svg>'
+
+
+_NAV_ACTIVE_CLASS = "flex items-center gap-3 p-3 bg-dark-700 rounded-lg text-accent"
+_NAV_CLASS = "flex items-center gap-3 p-3 hover:bg-dark-700 rounded-lg text-gray-400 hover:text-white transition"
+
+# (href, label, icon) for each sidebar entry
+_NAV_LINKS = (
+    ("/", "Dashboard", "dashboard"),
+    ("/live", "Live View", "live"),
+    ("#events", "Events", "alert"),
+    ("/docs", "API Docs", "cog"),
+)
+
+
+def _sidebar(active: str, show_events: bool = False) -> str:
+    """Build the sidebar shared by the standalone pages."""
+    nav = "".join(
+        f"""                <a href="{href}" class="{_NAV_ACTIVE_CLASS if href == active else _NAV_CLASS}">
+                    {_icon(icon, "w-5 h-5")}
+                    {label}
+                </a>
+"""
+        for href, label, icon in _NAV_LINKS
+        if show_events or href != "#events"
+    )
+    return f"""        <!-- Sidebar -->
+        <nav class="sidebar w-64 min-h-screen p-4 fixed left-0 top-0">
+            <div class="flex items-center gap-3 mb-8">
+                <div class="w-10 h-10 bg-accent rounded-lg flex items-center justify-center">
+                    {_icon("logo", "w-6 h-6 text-dark-900")}
+                </div>
+                <span class="text-xl font-semibold">SafetyVision</span>
+            </div>
+
+            <div class="space-y-2">
+{nav}            </div>
+        </nav>
+"""
+
+
 # Mount thumbnails
 thumbnails_path = Path("data/thumbnails")
 thumbnails_path.mkdir(parents=True, exist_ok=True)
-app.mount("/thumbnails", StaticFiles(directory=str(thumbnails_path)), name="thumbnails")
+# Thumbnails are named by a fresh event UUID and never rewritten, so
+# browsers can keep them for good
+app.mount(
+    "/thumbnails",
+    ImmutableStaticFiles(
+        directory=str(thumbnails_path),
+        cache_control=PRIVATE_IMMUTABLE_CACHE_CONTROL,
+    ),
+    name="thumbnails",
+)
 
 # Include API router
 app.include_router(api_router)
 
 
+# Only keep MJPEG streams open for feeds that are on screen: each <img>
+# carries its stream URL in data-src and gets a src while visible
+LAZY_STREAMS_JS = """
+        const streamObserver = new IntersectionObserver((entries) => {
+            for (const entry of entries) {
+                const img = entry.target;
+                if (entry.isIntersecting) img.src = img.dataset.src;
+                else img.removeAttribute('src');
+            }
+        }, { rootMargin: '100px' });
+
+        function observeStreams(container) {
+            streamObserver.disconnect();
+            container.querySelectorAll('img[data-src]').forEach((img) => streamObserver.observe(img));
+        }
+"""
+
+# Header clock: one cached formatter, ticks aligned to the second, and no
+# work at all while the tab is hidden
+CLOCK_JS = """
+        const clockFormat = new Intl.DateTimeFormat('en-US', {
+            weekday: 'short', month: 'short', day: 'numeric',
+            hour: '2-digit', minute: '2-digit', second: '2-digit'
+        });
+
+        function startClock(el) {
+            let timer = 0;
+            const tick = () => {
+                clearTimeout(timer);
+                if (document.hidden) return;
+                const now = new Date();
+                el.textContent = clockFormat.format(now);
+                timer = setTimeout(tick, 1000 - now.getMilliseconds());
+            };
+            document.addEventListener('visibilitychange', tick);
+            tick();
+        }
+"""
+
 # Dashboard HTML (temporary until React frontend is built)
 DASHBOARD_HTML = """
 <!DOCTYPE html>
@@ -197,24 +302,7 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Safety Video Analytics - Dashboard</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script>
-        tailwind.config = {
-            theme: {
-                extend: {
-                    colors: {
-                        dark: {
-                            900: '#0f0f1a',
-                            800: '#1a1a2e',
-                            700: '#252542',
-                            600: '#2f2f4a',
-                        },
-                        accent: '#00d4aa',
-                    }
-                }
-            }
-        }
-    </script>
+    """ + TAILWIND_LINK + """
     <style>
         body { background-color: #0f0f1a; }
         .sidebar { background-color: #1a1a2e; }
@@ -249,46 +337,7 @@ DASHBOARD_HTML = """
 </head>
 <body class="text-white min-h-screen">
     <div class="flex">
-        <!-- Sidebar -->
-        <nav class="sidebar w-64 min-h-screen p-4 fixed left-0 top-0">
-            <div class="flex items-center gap-3 mb-8">
-                <div class="w-10 h-10 bg-accent rounded-lg flex items-center justify-center">
-                    <svg class="w-6 h-6 text-dark-900" fill="currentColor" viewBox="0 0 20 20">
-                        <path d="M10 12a2 2 0 100-4 2 2 0 000 4z"/>
-                        <path fill-rule="evenodd" d="M.458 10C1.732 5.943 5.522 3 10 3s8.268 2.943 9.542 7c-1.274 4.057-5.064 7-9.542 7S1.732 14.057.458 10zM14 10a4 4 0 11-8 0 4 4 0 018 0z"/>
-                    </svg>
-                </div>
-                <span class="text-xl font-semibold">SafetyVision</span>
-            </div>
-
-            <div class="space-y-2">
-                <a href="/" class="flex items-center gap-3 p-3 bg-dark-700 rounded-lg text-accent">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path d="M3 4a1 1 0 011-1h12a1 1 0 011 1v2a1 1 0 01-1 1H4a1 1 0 01-1-1V4zm0 6a1 1 0 011-1h6a1 1 0 011 1v6a1 1 0 01-1 1H4a1 1 0 01-1-1v-6zm11-1a1 1 0 00-1 1v6a1 1 0 001 1h2a1 1 0 001-1v-6a1 1 0 00-1-1h-2z"/>
-                    </svg>
-                    Dashboard
-                </a>
-                <a href="/live" class="flex items-center gap-3 p-3 hover:bg-dark-700 rounded-lg text-gray-400 hover:text-white transition">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path d="M10 18a8 8 0 100-16 8 8 0 000 16zM9.555 7.168A1 1 0 008 8v4a1 1 0 001.555.832l3-2a1 1 0 000-1.664l-3-2z"/>
-                    </svg>
-                    Live View
-                </a>
-                <a href="#events" class="flex items-center gap-3 p-3 hover:bg-dark-700 rounded-lg text-gray-400 hover:text-white transition">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path fill-rule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92zM11 13a1 1 0 11-2 0 1 1 0 012 0zm-1-8a1 1 0 00-1 1v3a1 1 0 002 0V6a1 1 0 00-1-1z"/>
-                    </svg>
-                    Events
-                </a>
-                <a href="/docs" class="flex items-center gap-3 p-3 hover:bg-dark-700 rounded-lg text-gray-400 hover:text-white transition">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path fill-rule="evenodd" d="M11.49 3.17c-.38-1.56-2.6-1.56-2.98 0a1.532 1.532 0 01-2.286.948c-1.372-.836-2.942.734-2.106 2.106.54.886.061 2.042-.947 2.287-1.561.379-1.561 2.6 0 2.978a1.532 1.532 0 01.947 2.287c-.836 1.372.734 2.942 2.106 2.106a1.532 1.532 0 012.287.947c.379 1.561 2.6 1.561 2.978 0a1.533 1.533 0 012.287-.947c1.372.836 2.942-.734 2.106-2.106a1.533 1.533 0 01.947-2.287c1.561-.379 1.561-2.6 0-2.978a1.532 1.532 0 01-.947-2.287c.836-1.372-.734-2.942-2.106-2.106a1.532 1.532 0 01-2.287-.947zM10 13a3 3 0 100-6 3 3 0 000 6z"/>
-                    </svg>
-                    API Docs
-                </a>
-            </div>
-        </nav>
-
+""" + _sidebar("/", show_events=True) + """
         <!-- Main Content -->
         <main class="ml-64 flex-1 p-6">
             <!-- Header -->
@@ -312,9 +361,7 @@ DASHBOARD_HTML = """
                             <p id="violations-change" class="text-sm text-red-400 mt-1"></p>
                         </div>
                         <div class="w-12 h-12 bg-red-500/20 rounded-lg flex items-center justify-center">
-                            <svg class="w-6 h-6 text-red-500" fill="currentColor" viewBox="0 0 20 20">
-                                <path fill-rule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92z"/>
-                            </svg>
+                            """ + _icon("warning", "w-6 h-6 text-red-500") + """
                         </div>
                     </div>
                 </div>
@@ -330,9 +377,7 @@ DASHBOARD_HTML = """
                             <p class="text-sm text-green-400 mt-1">All systems online</p>
                         </div>
                         <div class="w-12 h-12 bg-green-500/20 rounded-lg flex items-center justify-center">
-                            <svg class="w-6 h-6 text-green-500" fill="currentColor" viewBox="0 0 20 20">
-                                <path d="M2 6a2 2 0 012-2h6a2 2 0 012 2v8a2 2 0 01-2 2H4a2 2 0 01-2-2V6zm12.553 1.106A1 1 0 0014 8v4a1 1 0 00.553.894l2 1A1 1 0 0018 13V7a1 1 0 00-1.447-.894l-2 1z"/>
-                            </svg>
+                            """ + _icon("video", "w-6 h-6 text-green-500") + """
                         </div>
                     </div>
                 </div>
@@ -345,10 +390,7 @@ DASHBOARD_HTML = """
                             <p class="text-sm text-accent mt-1">Frames analyzed</p>
                         </div>
                         <div class="w-12 h-12 bg-accent/20 rounded-lg flex items-center justify-center">
-                            <svg class="w-6 h-6 text-accent" fill="currentColor" viewBox="0 0 20 20">
-                                <path d="M13 7H7v6h6V7z"/>
-                                <path fill-rule="evenodd" d="M7 2a1 1 0 012 0v1h2V2a1 1 0 112 0v1h2a2 2 0 012 2v2h1a1 1 0 110 2h-1v2h1a1 1 0 110 2h-1v2a2 2 0 01-2 2h-2v1a1 1 0 11-2 0v-1H9v1a1 1 0 11-2 0v-1H5a2 2 0 01-2-2v-2H2a1 1 0 110-2h1V9H2a1 1 0 010-2h1V5a2 2 0 012-2h2V2z"/>
-                            </svg>
+                            """ + _icon("chip", "w-6 h-6 text-accent") + """
                         </div>
                     </div>
                 </div>
@@ -382,23 +424,17 @@ DASHBOARD_HTML = """
     <!-- Toast container -->
     <div id="toast-container"></div>
 
-    <script>
+    <script>""" + LAZY_STREAMS_JS + CLOCK_JS + """
         // Update datetime
-        function updateDateTime() {
-            const now = new Date();
-            document.getElementById('datetime').textContent = now.toLocaleString('en-US', {
-                weekday: 'short',
-                month: 'short',
-                day: 'numeric',
-                hour: '2-digit',
-                minute: '2-digit',
-                second: '2-digit'
-            });
-        }
-        setInterval(updateDateTime, 1000);
-        updateDateTime();
+        startClock(document.getElementById('datetime'));
 
         // Fetch and display stats
+        // Formatters are costly to build, so each is created once and reused
+        const countFormat = new Intl.NumberFormat();
+        const eventTimeFormat = new Intl.DateTimeFormat(undefined, {
+            hour: 'numeric', minute: '2-digit', second: '2-digit'
+        });
+
         async function fetchStats() {
             try {
                 const response = await fetch('/api/stats/summary');
@@ -407,7 +443,7 @@ DASHBOARD_HTML = """
                 document.getElementById('violations-count').textContent = data.violations_today;
                 document.getElementById('active-cameras').textContent = data.active_cameras;
                 document.getElementById('total-cameras').textContent = data.total_cameras;
-                document.getElementById('ai-scanned').textContent = data.ai_scanned.toLocaleString();
+                document.getElementById('ai-scanned').textContent = countFormat.format(data.ai_scanned);
 
                 const change = data.violations_change_percent;
                 const changeEl = document.getElementById('violations-change');
@@ -426,6 +462,40 @@ DASHBOARD_HTML = """
             }
         }
 
+        // Card and event markup is parsed once and cloned per item
+        function template(html) {
+            const tpl = document.createElement('template');
+            tpl.innerHTML = html.trim();
+            return tpl.content.firstElementChild;
+        }
+
+        const cameraCardTemplate = template(`
+            <div class="camera-feed relative">
+                <img class="w-full aspect-video object-cover">
+                <div class="absolute top-2 left-2 flex items-center gap-2">
+                    <span data-role="zone"></span>
+                </div>
+                <div class="absolute bottom-2 left-2 right-2 flex justify-between items-center">
+                    <span class="text-sm font-medium" data-role="name"></span>
+                    <span class="text-xs text-gray-400" data-role="fps"></span>
+                </div>
+            </div>
+        `);
+
+        const eventItemTemplate = template(`
+            <div class="event-item">
+                <div class="flex items-start gap-3">
+                    <div class="w-8 h-8 bg-red-500/20 rounded flex items-center justify-center flex-shrink-0">
+                        """ + _icon("warning", "w-4 h-4 text-red-500") + """
+                    </div>
+                    <div class="flex-1 min-w-0">
+                        <p class="text-sm font-medium" data-role="message"></p>
+                        <p class="text-xs text-gray-500" data-role="time"></p>
+                    </div>
+                </div>
+            </div>
+        `);
+
         // Fetch and display cameras
         async function fetchCameras() {
             try {
@@ -433,18 +503,21 @@ DASHBOARD_HTML = """
                 const data = await response.json();
 
                 const grid = document.getElementById('camera-grid');
-                grid.innerHTML = data.cameras.map(cam => `
-                    <div class="camera-feed relative">
-                        <img src="/api/stream/${cam.id}" alt="${cam.name}" class="w-full aspect-video object-cover">
-                        <div class="absolute top-2 left-2 flex items-center gap-2">
-                            <span class="zone-tag zone-${cam.zone.toLowerCase()}">${cam.zone}</span>
-                        </div>
-                        <div class="absolute bottom-2 left-2 right-2 flex justify-between items-center">
-                            <span class="text-sm font-medium">${cam.name}</span>
-                            <span class="text-xs text-gray-400">${cam.fps.toFixed(1)} FPS</span>
-                        </div>
-                    </div>
-                `).join('');
+                const fragment = document.createDocumentFragment();
+                for (const cam of data.cameras) {
+                    const card = cameraCardTemplate.cloneNode(true);
+                    const img = card.querySelector('img');
+                    img.dataset.src = `/api/stream/${cam.id}`;
+                    img.alt = cam.name;
+                    const zone = card.querySelector('[data-role="zone"]');
+                    zone.className = `zone-tag zone-${cam.zone.toLowerCase()}`;
+                    zone.textContent = cam.zone;
+                    card.querySelector('[data-role="name"]').textContent = cam.name;
+                    card.querySelector('[data-role="fps"]').textContent = `${cam.fps.toFixed(1)} FPS`;
+                    fragment.appendChild(card);
+                }
+                grid.replaceChildren(fragment);
+                observeStreams(grid);
             } catch (e) {
                 console.error('Failed to fetch cameras:', e);
             }
@@ -460,40 +533,36 @@ DASHBOARD_HTML = """
                 if (data.events.length === 0) {
                     feed.innerHTML = '<p class="text-gray-500 text-center py-8">No recent events</p>';
                 } else {
-                    feed.innerHTML = data.events.map(event => `
-                        <div class="event-item ${event.severity}">
-                            <div class="flex items-start gap-3">
-                                <div class="w-8 h-8 bg-red-500/20 rounded flex items-center justify-center flex-shrink-0">
-                                    <svg class="w-4 h-4 text-red-500" fill="currentColor" viewBox="0 0 20 20">
-                                        <path fill-rule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92z"/>
-                                    </svg>
-                                </div>
-                                <div class="flex-1 min-w-0">
-                                    <p class="text-sm font-medium">${event.message}</p>
-                                    <p class="text-xs text-gray-500">${new Date(event.timestamp).toLocaleTimeString()}</p>
-                                </div>
-                            </div>
-                        </div>
-                    `).join('');
+                    const fragment = document.createDocumentFragment();
+                    for (const event of data.events) {
+                        const item = eventItemTemplate.cloneNode(true);
+                        if (event.severity) item.classList.add(event.severity);
+                        item.querySelector('[data-role="message"]').textContent = event.message;
+                        item.querySelector('[data-role="time"]').textContent = eventTimeFormat.format(new Date(event.timestamp));
+                        fragment.appendChild(item);
+                    }
+                    feed.replaceChildren(fragment);
                 }
             } catch (e) {
                 console.error('Failed to fetch events:', e);
             }
         }
 
-        // Show toast notification
-        function showToast(message, type = 'error') {
-            const container = document.getElementById('toast-container');
-            const toast = document.createElement('div');
-            toast.className = 'toast';
-            toast.innerHTML = `
+        // Show toast notification; the message is server data, so it is
+        // set as text rather than parsed as HTML
+        const toastTemplate = template(`
+            <div class="toast">
                 <div class="flex items-center gap-3">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path fill-rule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92z"/>
-                    </svg>
-                    <span>${message}</span>
+                    """ + _icon("warning", "w-5 h-5") + """
+                    <span></span>
                 </div>
-            `;
+            </div>
+        `);
+
+        function showToast(message, type = 'error') {
+            const container = document.getElementById('toast-container');
+            const toast = toastTemplate.cloneNode(true);
+            toast.querySelector('span').textContent = message;
             container.appendChild(toast);
             setTimeout(() => toast.remove(), 5000);
         }
@@ -533,19 +602,7 @@ LIVE_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Safety Video Analytics - Live View</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script>
-        tailwind.config = {
-            theme: {
-                extend: {
-                    colors: {
-                        dark: { 900: '#0f0f1a', 800: '#1a1a2e', 700: '#252542', 600: '#2f2f4a' },
-                        accent: '#00d4aa',
-                    }
-                }
-            }
-        }
-    </script>
+    """ + TAILWIND_LINK + """
     <style>
         body { background-color: #0f0f1a; }
         .sidebar { background-color: #1a1a2e; }
@@ -555,46 +612,14 @@ LIVE_HTML = """
         .zone-warehouse { background-color: rgba(255, 165, 0, 0.3); color: #ffa500; }
         .zone-production { background-color: rgba(0, 255, 0, 0.3); color: #00ff00; }
         .zone-common { background-color: rgba(0, 255, 255, 0.3); color: #00ffff; }
+        .camera-grid { display: grid; gap: 1.5rem; grid-template-columns: repeat(var(--cols, 2), minmax(0, 1fr)); }
         .status-dot { width: 8px; height: 8px; border-radius: 50%; background: #00ff00; animation: pulse 2s infinite; }
         @keyframes pulse { 0%, 100% { opacity: 1; } 50% { opacity: 0.5; } }
     </style>
 </head>
 <body class="text-white min-h-screen">
     <div class="flex">
-        <!-- Sidebar -->
-        <nav class="sidebar w-64 min-h-screen p-4 fixed left-0 top-0">
-            <div class="flex items-center gap-3 mb-8">
-                <div class="w-10 h-10 bg-accent rounded-lg flex items-center justify-center">
-                    <svg class="w-6 h-6 text-dark-900" fill="currentColor" viewBox="0 0 20 20">
-                        <path d="M10 12a2 2 0 100-4 2 2 0 000 4z"/>
-                        <path fill-rule="evenodd" d="M.458 10C1.732 5.943 5.522 3 10 3s8.268 2.943 9.542 7c-1.274 4.057-5.064 7-9.542 7S1.732 14.057.458 10zM14 10a4 4 0 11-8 0 4 4 0 018 0z"/>
-                    </svg>
-                </div>
-                <span class="text-xl font-semibold">SafetyVision</span>
-            </div>
-
-            <div class="space-y-2">
-                <a href="/" class="flex items-center gap-3 p-3 hover:bg-dark-700 rounded-lg text-gray-400 hover:text-white transition">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path d="M3 4a1 1 0 011-1h12a1 1 0 011 1v2a1 1 0 01-1 1H4a1 1 0 01-1-1V4zm0 6a1 1 0 011-1h6a1 1 0 011 1v6a1 1 0 01-1 1H4a1 1 0 01-1-1v-6zm11-1a1 1 0 00-1 1v6a1 1 0 001 1h2a1 1 0 001-1v-6a1 1 0 00-1-1h-2z"/>
-                    </svg>
-                    Dashboard
-                </a>
-                <a href="/live" class="flex items-center gap-3 p-3 bg-dark-700 rounded-lg text-accent">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path d="M10 18a8 8 0 100-16 8 8 0 000 16zM9.555 7.168A1 1 0 008 8v4a1 1 0 001.555.832l3-2a1 1 0 000-1.664l-3-2z"/>
-                    </svg>
-                    Live View
-                </a>
-                <a href="/docs" class="flex items-center gap-3 p-3 hover:bg-dark-700 rounded-lg text-gray-400 hover:text-white transition">
-                    <svg class="w-5 h-5" fill="currentColor" viewBox="0 0 20 20">
-                        <path fill-rule="evenodd" d="M11.49 3.17c-.38-1.56-2.6-1.56-2.98 0a1.532 1.532 0 01-2.286.948c-1.372-.836-2.942.734-2.106 2.106.54.886.061 2.042-.947 2.287-1.561.379-1.561 2.6 0 2.978a1.532 1.532 0 01.947 2.287c-.836 1.372.734 2.942 2.106 2.106a1.532 1.532 0 012.287.947c.379 1.561 2.6 1.561 2.978 0a1.533 1.533 0 012.287-.947c1.372.836 2.942-.734 2.106-2.106a1.533 1.533 0 01.947-2.287c1.561-.379 1.561-2.6 0-2.978a1.532 1.532 0 01-.947-2.287c.836-1.372-.734-2.942-2.106-2.106a1.532 1.532 0 01-2.287-.947zM10 13a3 3 0 100-6 3 3 0 000 6z"/>
-                    </svg>
-                    API Docs
-                </a>
-            </div>
-        </nav>
-
+""" + _sidebar("/live") + """
         <!-- Main Content -->
         <main class="ml-64 flex-1 p-6">
             <div class="flex justify-between items-center mb-6">
@@ -612,22 +637,34 @@ LIVE_HTML = """
                 </div>
             </div>
 
-            <div id="camera-grid" class="grid grid-cols-2 gap-6">
+            <div id="camera-grid" class="camera-grid">
                 <!-- Camera feeds will be inserted here -->
             </div>
         </main>
     </div>
 
-    <script>
-        function updateDateTime() {
-            const now = new Date();
-            document.getElementById('datetime').textContent = now.toLocaleString('en-US', {
-                weekday: 'short', month: 'short', day: 'numeric',
-                hour: '2-digit', minute: '2-digit', second: '2-digit'
-            });
-        }
-        setInterval(updateDateTime, 1000);
-        updateDateTime();
+    <script>""" + LAZY_STREAMS_JS + CLOCK_JS + """
+        startClock(document.getElementById('datetime'));
+
+        // Feed markup is parsed once and cloned per camera
+        const cameraFeedTemplate = (() => {
+            const tpl = document.createElement('template');
+            tpl.innerHTML = `
+                <div class="camera-feed">
+                    <img class="w-full aspect-video object-cover">
+                    <div class="absolute top-3 left-3 flex items-center gap-2">
+                        <div class="status-dot"></div>
+                        <span data-role="zone"></span>
+                    </div>
+                    <div class="absolute top-3 right-3 bg-black/50 px-2 py-1 rounded text-xs" data-role="fps"></div>
+                    <div class="absolute bottom-0 left-0 right-0 bg-gradient-to-t from-black/80 to-transparent p-4">
+                        <h3 class="font-semibold" data-role="name"></h3>
+                        <p class="text-sm text-gray-400" data-role="camera-id"></p>
+                    </div>
+                </div>
+            `.trim();
+            return tpl.content.firstElementChild;
+        })();
 
         async function fetchCameras() {
             try {
@@ -635,34 +672,30 @@ LIVE_HTML = """
                 const data = await response.json();
 
                 const grid = document.getElementById('camera-grid');
-                grid.innerHTML = data.cameras.map(cam => `
-                    <div class="camera-feed">
-                        <img src="/api/stream/${cam.id}" alt="${cam.name}" class="w-full aspect-video object-cover">
-                        <div class="absolute top-3 left-3 flex items-center gap-2">
-                            <div class="status-dot"></div>
-                            <span class="zone-tag zone-${cam.zone.toLowerCase()}">${cam.zone}</span>
-                        </div>
-                        <div class="absolute top-3 right-3 bg-black/50 px-2 py-1 rounded text-xs">
-                            ${cam.fps.toFixed(1)} FPS
-                        </div>
-                        <div class="absolute bottom-0 left-0 right-0 bg-gradient-to-t from-black/80 to-transparent p-4">
-                            <h3 class="font-semibold">${cam.name}</h3>
-                            <p class="text-sm text-gray-400">Camera ${cam.id}</p>
-                        </div>
-                    </div>
-                `).join('');
+                const fragment = document.createDocumentFragment();
+                for (const cam of data.cameras) {
+                    const feed = cameraFeedTemplate.cloneNode(true);
+                    const img = feed.querySelector('img');
+                    img.dataset.src = `/api/stream/${cam.id}`;
+                    img.alt = cam.name;
+                    const zone = feed.querySelector('[data-role="zone"]');
+                    zone.className = `zone-tag zone-${cam.zone.toLowerCase()}`;
+                    zone.textContent = cam.zone;
+                    feed.querySelector('[data-role="fps"]').textContent = `${cam.fps.toFixed(1)} FPS`;
+                    feed.querySelector('[data-role="name"]').textContent = cam.name;
+                    feed.querySelector('[data-role="camera-id"]').textContent = `Camera ${cam.id}`;
+                    fragment.appendChild(feed);
+                }
+                grid.replaceChildren(fragment);
+                observeStreams(grid);
             } catch (e) {
                 console.error('Failed to fetch cameras:', e);
             }
         }
 
+        // Option values are "<cols>x<rows>"; the grid's column count is --cols
         document.getElementById('layout-select').addEventListener('change', (e) => {
-            const grid = document.getElementById('camera-grid');
-            switch (e.target.value) {
-                case '1x1': grid.className = 'grid grid-cols-1 gap-6'; break;
-                case '2x2': grid.className = 'grid grid-cols-2 gap-6'; break;
-                case '3x2': grid.className = 'grid grid-cols-3 gap-6'; break;
-            }
+            document.getElementById('camera-grid').style.setProperty('--cols', e.target.value.split('x')[0]);
         });
 
         fetchCameras();
@@ -672,16 +705,21 @@ LIVE_HTML = """
 """
 
 
+# Encoded, hashed and precompressed once, on first request
+DASHBOARD_PAGE = HTMLPage(lambda: DASHBOARD_HTML)
+LIVE_PAGE = HTMLPage(lambda: LIVE_HTML)
+
+
 @app.get("/", response_class=HTMLResponse)
-async def dashboard():
+async def dashboard(request: Request):
     """Serve the dashboard page."""
-    return HTMLResponse(content=DASHBOARD_HTML)
+    return DASHBOARD_PAGE.response(request)
 
 
 @app.get("/live", response_class=HTMLResponse)
-async def live_view():
+async def live_view(request: Request):
     """Serve the live view page."""
-    return HTMLResponse(content=LIVE_HTML)
+    return LIVE_PAGE.response(request)
 
 
 def main():
@@ -1,13 +1,13 @@
 """User repository."""
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import User, UserRole
+from ..models import Organization, User, UserRole
 from .base import TenantRepository
 
 
@@ -58,6 +58,37 @@ class UserRepository(TenantRepository[User]):
         result = await self.session.execute(query)
         return result.scalar_one() > 0
 
+    async def create_user_preflight(
+        self, email: str
+    ) -> Optional[Tuple[int, int, bool]]:
+        """
+        Fetch everything needed to validate a new user in one round-trip.
+
+        Returns:
+            (max_users, current user count, email already exists), or None
+            if the organization does not exist
+        """
+        user_count = (
+            select(func.count())
+            .select_from(User)
+            .where(User.organization_id == self.organization_id)
+            .scalar_subquery()
+        )
+        email_taken = (
+            select(User.id)
+            .where(User.organization_id == self.organization_id)
+            .where(User.email == email)
+            .exists()
+        )
+        query = select(
+            Organization.max_users, user_count, email_taken
+        ).where(Organization.id == self.organization_id)
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1], bool(row[2])
+
 
 class GlobalUserRepository:
     """Repository for cross-organization user lookups (auth only)."""
@@ -14,6 +14,10 @@ from .client import get_redis
 # Channel patterns
 FRAME_CHANNEL_PREFIX = "frames:"
 EVENT_CHANNEL_PREFIX = "events:"
+# Web service's cached camera list per organization (see api/v1/cameras.py)
+CAMERA_LIST_CACHE_PREFIX = "camera_list:"
+# Web workers drop cached camera ownership checks ("<org_id>:<camera_id>")
+CAMERA_ACCESS_INVALIDATION_CHANNEL = "camera_access:invalidate"
 
 # Subscriber count cache (shared across instances)
 _subscriber_cache: Dict[str, tuple[int, float]] = {}
@@ -179,6 +183,21 @@ class FrameSubscriber:
             self._pubsub = None
 
 
+# Per-viewer frame buffer for the shared broadcaster: one slot, so a slow
+# viewer always gets the newest frame next rather than a backlog
+_VIEWER_QUEUE_SIZE = 1
+
+
+def _put_drop_oldest(queue: asyncio.Queue, item: bytes) -> None:
+    """Enqueue without blocking, evicting the oldest item if the queue is full."""
+    if queue.full():
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(item)
+
+
 class SharedFrameBroadcaster:
     """
     Shared broadcaster for frame streaming.
@@ -207,13 +226,19 @@ class SharedFrameBroadcaster:
         Yields:
             JPEG-encoded frame bytes
         """
-        queue: asyncio.Queue = asyncio.Queue(maxsize=5)  # Buffer up to 5 frames
+        # Small buffer: slow viewers drop their oldest frames, not the newest
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_VIEWER_QUEUE_SIZE)
 
         async with self._lock:
+            existing = self._subscriptions.get(camera_id)
+            if existing is not None and existing[2].done():
+                # Listener died (e.g. Redis dropped); rebuild it for all viewers
+                await self._cleanup_subscription(camera_id)
+
             if camera_id not in self._subscriptions:
                 # Create new subscription for this camera
                 pubsub = self.client.pubsub()
-                clients: set = set()
+                clients: set = existing[1] if existing is not None else set()
                 channel = f"{FRAME_CHANNEL_PREFIX}{camera_id}"
                 await pubsub.subscribe(channel)
 
@@ -270,10 +295,7 @@ class SharedFrameBroadcaster:
                     dead_clients = []
                     for queue in list(clients):
                         try:
-                            # Non-blocking put, drop frame if queue is full
-                            queue.put_nowait(frame_data)
-                        except asyncio.QueueFull:
-                            pass  # Client is too slow, skip this frame
+                            _put_drop_oldest(queue, frame_data)
                         except Exception:
                             dead_clients.append(queue)
 
@@ -366,6 +388,45 @@ class EventPublisher:
         }
         return await self.publish_event(organization_id, event_data)
 
+    async def publish_camera_status(
+        self,
+        organization_id: str,
+        camera_id: str,
+        status: str,
+        error_message: Optional[str] = None,
+    ) -> int:
+        """Publish a camera status change."""
+        # The cached camera list carries the old status; drop it first so a
+        # refetch triggered by this event reads the new one
+        await self.client.delete(f"{CAMERA_LIST_CACHE_PREFIX}{organization_id}")
+        event_data = {
+            "type": "camera_status",
+            "data": {
+                "camera_id": camera_id,
+                "status": status,
+                "error_message": error_message,
+            },
+        }
+        return await self.publish_event(organization_id, event_data)
+
+    async def publish_camera_fps(
+        self,
+        organization_id: str,
+        camera_id: str,
+        fps: float,
+        infer_fps: float,
+    ) -> int:
+        """Publish a camera's current stream and inference frame rates."""
+        event_data = {
+            "type": "camera_fps",
+            "data": {
+                "camera_id": camera_id,
+                "fps": fps,
+                "infer_fps": infer_fps,
+            },
+        }
+        return await self.publish_event(organization_id, event_data)
+
     async def close(self) -> None:
         """Close the Redis connection."""
         if self.client:
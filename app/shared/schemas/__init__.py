@@ -29,6 +29,7 @@ from .stats import (
     DailyStatsResponse,
     ViolationBreakdownResponse,
 )
+from .dashboard import DashboardBootstrapResponse
 
 __all__ = [
     # Auth
@@ -55,4 +56,6 @@ __all__ = [
     "StatsSummaryResponse",
     "DailyStatsResponse",
     "ViolationBreakdownResponse",
+    # Dashboard
+    "DashboardBootstrapResponse",
 ]
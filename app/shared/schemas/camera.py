@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class CameraCreate(BaseModel):
@@ -108,6 +108,17 @@ class CameraResponse(BaseModel):
     infer_fps: float = 0.0
     detection_count: int = 0
 
+    # Display strings, so the dashboard doesn't reformat them on every refresh
+    @computed_field
+    @property
+    def short_id(self) -> str:
+        return str(self.id)[:8]
+
+    @computed_field
+    @property
+    def fps_display(self) -> str:
+        return f"Stream {self.fps:.1f} FPS | AI {self.infer_fps:.1f} FPS"
+
     class Config:
         from_attributes = True
 
@@ -0,0 +1,21 @@
+"""Dashboard schemas."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .auth import UserResponse
+from .camera import CameraListResponse
+from .event import EventListResponse
+from .stats import StatsSummaryResponse
+
+
+class DashboardBootstrapResponse(BaseModel):
+    """Everything the dashboard needs on load, in one response.
+
+    Sections the client did not ask for are left as None.
+    """
+    user: Optional[UserResponse] = None
+    stats: Optional[StatsSummaryResponse] = None
+    cameras: Optional[CameraListResponse] = None
+    events: Optional[EventListResponse] = None
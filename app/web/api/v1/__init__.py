@@ -10,6 +10,7 @@ from .stream import router as stream_router
 from .sse import router as sse_router
 from .users import router as users_router
 from .organizations import router as organizations_router
+from .dashboard import router as dashboard_router
 
 # Create main API router
 router = APIRouter(prefix="/api/v1")
@@ -21,5 +22,6 @@ router.include_router(organizations_router, prefix="/organization", tags=["organ
 router.include_router(cameras_router, prefix="/cameras", tags=["cameras"])
 router.include_router(events_router, prefix="/events", tags=["events"])
 router.include_router(stats_router, prefix="/stats", tags=["stats"])
+router.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
 router.include_router(stream_router, tags=["streaming"])
 router.include_router(sse_router, tags=["sse"])
@@ -18,12 +18,12 @@ from ....shared.schemas.auth import (
     ChangePasswordRequest,
 )
 from ...auth import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     get_current_user,
 )
-from ...auth.dependencies import AuthContext
+from ...auth.dependencies import AuthContext, invalidate_user_cache
 from ...auth.jwt import get_token_expiry_seconds
 from ...config import config
 
@@ -110,7 +110,7 @@ async def register(
     user = User(
         organization_id=org.id,
         email=request.email,
-        password_hash=hash_password(request.password),
+        password_hash=await hash_password_async(request.password),
         full_name=request.full_name,
         role=UserRole.ADMIN,
     )
@@ -151,7 +151,7 @@ async def login(
         )
 
     # Verify password
-    if not verify_password(request.password, user.password_hash):
+    if not await verify_password_async(request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -224,15 +224,24 @@ async def change_password(
     """
     Change current user's password.
     """
+    # Reload the user in this session (auth.user is a read-only snapshot)
+    user = await GlobalUserRepository(db).get_by_id_global(auth.user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+
     # Verify current password
-    if not verify_password(request.current_password, auth.user.password_hash):
+    if not await verify_password_async(request.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
     # Update password
-    auth.user.password_hash = hash_password(request.new_password)
-    await db.flush()
+    user.password_hash = await hash_password_async(request.new_password)
+    await db.commit()
+    invalidate_user_cache(user.id)
 
     return {"message": "Password changed successfully"}
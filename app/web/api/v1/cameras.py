@@ -3,7 +3,8 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....shared.db.database import get_db_session
@@ -11,7 +12,8 @@ from ....shared.db.models import Camera, SourceType, DetectionMode, CameraStatus
 from ....shared.db.repositories.cameras import CameraRepository
 from ....shared.db.repositories.organizations import OrganizationRepository
 from ....shared.encryption import encrypt_credentials, is_encryption_configured
-from ....shared.redis.pubsub import get_frame_subscriber
+from ....shared.redis.client import get_redis
+from ....shared.redis.pubsub import CAMERA_LIST_CACHE_PREFIX, get_frame_subscriber
 from ....shared.schemas.camera import (
     CameraCreate,
     CameraUpdate,
@@ -21,9 +23,17 @@ from ....shared.schemas.camera import (
     CameraTestResponse,
 )
 from ...auth.dependencies import CurrentUser, AdminUser
+from .stream import invalidate_camera_access
 
 router = APIRouter()
 
+# Camera config only changes through this API or a worker status update,
+# both of which drop the cache; the TTL bounds anything else (last_seen)
+CAMERA_LIST_CACHE_TTL = 30
+_camera_list_adapter = TypeAdapter(List[CameraResponse])
+# Serializes a whole list response in one pydantic-core call
+_camera_list_response_adapter = TypeAdapter(CameraListResponse)
+
 
 def _parse_float(value: Optional[str], default: float = 0.0) -> float:
     """Parse float from Redis metadata."""
@@ -103,6 +113,65 @@ def camera_to_response(
     )
 
 
+async def _with_runtime_stats(cameras: List[CameraResponse]) -> CameraListResponse:
+    """Fill in live fps and detection counts from Redis."""
+    runtime_stats = await _get_runtime_stats([c.id for c in cameras])
+    return CameraListResponse(
+        cameras=[
+            c.model_copy(update=runtime_stats[c.id]) if c.id in runtime_stats else c
+            for c in cameras
+        ],
+        total=len(cameras),
+    )
+
+
+async def build_camera_list(cameras: List[Camera]) -> CameraListResponse:
+    """Convert cameras to a list response with live fps from Redis."""
+    return await _with_runtime_stats([camera_to_response(c) for c in cameras])
+
+
+async def build_organization_camera_list(
+    db: AsyncSession,
+    organization_id: UUID,
+) -> CameraListResponse:
+    """
+    List all of an organization's cameras, with live fps from Redis.
+
+    The camera config is cached in Redis per organization, so dashboards
+    polling this skip the database until a camera changes.
+    """
+    key = f"{CAMERA_LIST_CACHE_PREFIX}{organization_id}"
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+    except Exception:
+        redis = cached = None
+
+    if cached is not None:
+        cameras = _camera_list_adapter.validate_json(cached)
+    else:
+        camera_list, _ = await CameraRepository(db, organization_id).get_all(limit=1000)
+        cameras = [camera_to_response(c) for c in camera_list]
+        if redis is not None:
+            try:
+                await redis.set(
+                    key, _camera_list_adapter.dump_json(cameras), ex=CAMERA_LIST_CACHE_TTL
+                )
+            except Exception:
+                pass
+
+    return await _with_runtime_stats(cameras)
+
+
+async def invalidate_camera_list(organization_id: UUID) -> None:
+    """Drop an organization's cached camera list (call after committing a change)."""
+    try:
+        redis = await get_redis()
+        await redis.delete(f"{CAMERA_LIST_CACHE_PREFIX}{organization_id}")
+    except Exception:
+        pass
+
+
 @router.get("", response_model=CameraListResponse)
 async def list_cameras(
     auth: CurrentUser,
@@ -116,24 +185,19 @@ async def list_cameras(
     camera_repo = CameraRepository(db, auth.organization_id)
 
     if zone:
-        cameras = await camera_repo.get_by_zone(zone)
+        camera_list = await build_camera_list(await camera_repo.get_by_zone(zone))
     elif status_filter:
-        cameras = await camera_repo.get_by_status(CameraStatus(status_filter))
+        camera_list = await build_camera_list(
+            await camera_repo.get_by_status(CameraStatus(status_filter))
+        )
     else:
-        cameras, _ = await camera_repo.get_all(limit=1000)
+        camera_list = await build_organization_camera_list(db, auth.organization_id)
 
-    runtime_stats = await _get_runtime_stats([c.id for c in cameras])
-    return CameraListResponse(
-        cameras=[
-            camera_to_response(
-                c,
-                fps=runtime_stats.get(c.id, {}).get("fps", 0.0),
-                infer_fps=runtime_stats.get(c.id, {}).get("infer_fps", 0.0),
-                detection_count=runtime_stats.get(c.id, {}).get("detection_count", 0),
-            )
-            for c in cameras
-        ],
-        total=len(cameras),
+    # Already a validated model: return the encoded JSON directly rather
+    # than have response_model re-validate and re-encode every camera
+    return Response(
+        content=_camera_list_response_adapter.dump_json(camera_list),
+        media_type="application/json",
     )
 
 
@@ -191,6 +255,9 @@ async def create_camera(
         zone_polygon=request.zone_polygon,
     )
     camera = await camera_repo.create(camera)
+    # Commit before invalidating, or a read in between re-caches the old list
+    await db.commit()
+    await invalidate_camera_list(auth.organization_id)
 
     return camera_to_response(camera)
 
@@ -287,6 +354,8 @@ async def update_camera(
         camera.inference_enabled = request.inference_enabled
 
     await camera_repo.update(camera)
+    await db.commit()
+    await invalidate_camera_list(auth.organization_id)
     return camera_to_response(camera)
 
 
@@ -308,6 +377,10 @@ async def delete_camera(
             detail="Camera not found",
         )
 
+    await db.commit()
+    await invalidate_camera_access(auth.organization_id, camera_id)
+    await invalidate_camera_list(auth.organization_id)
+
 
 @router.post("/{camera_id}/test", response_model=CameraTestResponse)
 async def test_camera_connection(
@@ -0,0 +1,44 @@
+"""Dashboard bootstrap endpoint."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....shared.db.database import get_db_session
+from ....shared.schemas.auth import UserResponse
+from ....shared.schemas.dashboard import DashboardBootstrapResponse
+from ...auth.dependencies import CurrentUser
+from .cameras import build_organization_camera_list
+from .events import build_live_events
+from .stats import build_stats_summary
+
+router = APIRouter()
+
+
+@router.get("/bootstrap", response_model=DashboardBootstrapResponse)
+async def get_dashboard_bootstrap(
+    auth: CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    user: bool = True,
+    stats: bool = True,
+    cameras: bool = True,
+    events: bool = True,
+    events_limit: int = Query(default=10, ge=1, le=50),
+):
+    """
+    Get the current user, stats summary, cameras and live events in one call.
+
+    Each section can be switched off with its query flag so periodic
+    refreshes only load what they need.
+    """
+    response = DashboardBootstrapResponse()
+
+    if user:
+        response.user = UserResponse.model_validate(auth.user)
+    if stats:
+        response.stats = await build_stats_summary(db, auth.organization_id)
+    if cameras:
+        response.cameras = await build_organization_camera_list(db, auth.organization_id)
+    if events:
+        response.events = await build_live_events(db, auth.organization_id, events_limit)
+
+    return response
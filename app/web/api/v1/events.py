@@ -110,17 +110,12 @@ async def list_events(
     )
 
 
-@router.get("/live", response_model=EventListResponse)
-async def get_live_events(
-    auth: CurrentUser,
-    db: AsyncSession = Depends(get_db_session),
-    limit: int = Query(default=10, ge=1, le=50),
-):
-    """
-    Get most recent events for live feed.
-    """
-    event_repo = EventRepository(db, auth.organization_id)
-    camera_repo = CameraRepository(db, auth.organization_id)
+async def build_live_events(
+    db: AsyncSession, organization_id: UUID, limit: int
+) -> EventListResponse:
+    """Load the most recent events for an organization's live feed."""
+    event_repo = EventRepository(db, organization_id)
+    camera_repo = CameraRepository(db, organization_id)
 
     events = await event_repo.get_recent(limit=limit)
 
@@ -142,6 +137,18 @@ async def get_live_events(
     )
 
 
+@router.get("/live", response_model=EventListResponse)
+async def get_live_events(
+    auth: CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    """
+    Get most recent events for live feed.
+    """
+    return await build_live_events(db, auth.organization_id, limit)
+
+
 @router.get("/{event_id}", response_model=EventResponse)
 async def get_event(
     event_id: UUID,
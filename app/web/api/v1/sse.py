@@ -2,17 +2,106 @@
 
 import asyncio
 import json
-from typing import AsyncGenerator
+import logging
+from typing import AsyncGenerator, Dict, List, Tuple
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request
 from sse_starlette.sse import EventSourceResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ....shared.db.database import get_db_session
+try:
+    import orjson
+except ImportError:  # Rust JSON encoder unavailable, fall back to stdlib json
+    orjson = None
+
+from ....shared.db.database import get_db, get_db_session
 from ....shared.redis.pubsub import get_event_subscriber
 from ...auth.dependencies import CurrentUser
+from .events import build_live_events
+from .stats import build_stats_summary
 
 router = APIRouter()
+logger = logging.getLogger("sva.web.sse")
+
+# Matches the dashboard's activity feed length
+LIVE_EVENTS_LIMIT = 10
+
+# Trailing delay before pushing stats/events after a violation, so a burst
+# of violations costs one refresh instead of one per event
+DASHBOARD_UPDATE_DELAY = 0.25
+# Upper bound on that wait, so a steady stream of violations still gets
+# a refresh at least this often instead of postponing it indefinitely
+DASHBOARD_UPDATE_MAX_DELAY = 1.0
+
+# Fixed payloads are encoded once rather than on every connection/tick
+_CONNECTED_DATA = json.dumps({"status": "connected"})
+_CONNECTED_POLLING_DATA = json.dumps({"status": "connected", "mode": "polling"})
+_HEARTBEAT_DATA = json.dumps({"status": "ok"})
+
+
+def _encode_data(data) -> str:
+    """Encode a forwarded event payload, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+async def dashboard_updates(organization_id: UUID) -> List[dict]:
+    """
+    Build the stats and events messages pushed after a violation.
+
+    Payloads match /stats/summary and /events/live, so the dashboard
+    can render them without polling those endpoints.
+    """
+    async with get_db() as db:
+        stats = await build_stats_summary(db, organization_id)
+        events = await build_live_events(db, organization_id, LIVE_EVENTS_LIMIT)
+
+    return [
+        {"event": "stats", "data": stats.model_dump_json()},
+        {"event": "events", "data": events.model_dump_json()},
+    ]
+
+
+# Latest dashboard refresh per organization (organization_id -> (started_at,
+# task)). Every connection of an organization sees the same violations, so
+# they share one refresh instead of each querying the database.
+_DASHBOARD_REFRESHES: Dict[UUID, Tuple[float, asyncio.Future]] = {}
+
+
+def _forget_refresh(organization_id: UUID, entry: Tuple[float, asyncio.Future]) -> None:
+    if _DASHBOARD_REFRESHES.get(organization_id) is entry:
+        del _DASHBOARD_REFRESHES[organization_id]
+
+
+def _refresh_done(organization_id: UUID, entry: Tuple[float, asyncio.Future]) -> None:
+    task = entry[1]
+    if not task.cancelled() and task.exception() is not None:
+        # Failed refreshes are not shared; the next caller starts a new one
+        _forget_refresh(organization_id, entry)
+        return
+    # Keep the result for connections still waiting out their delay
+    asyncio.get_running_loop().call_later(
+        DASHBOARD_UPDATE_MAX_DELAY, _forget_refresh, organization_id, entry
+    )
+
+
+async def shared_dashboard_updates(organization_id: UUID, since: float) -> List[dict]:
+    """
+    Get the dashboard refresh for an organization, shared per process.
+
+    Reuses a refresh started at or after since (loop time of the violation
+    the caller is reacting to), so it cannot predate that violation.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _DASHBOARD_REFRESHES.get(organization_id)
+    if entry is None or entry[0] < since:
+        entry = (loop.time(), asyncio.ensure_future(dashboard_updates(organization_id)))
+        _DASHBOARD_REFRESHES[organization_id] = entry
+        entry[1].add_done_callback(lambda _, e=entry: _refresh_done(organization_id, e))
+    # Shielded so one client disconnecting doesn't cancel it for the rest
+    return await asyncio.shield(entry[1])
 
 
 async def event_generator(
@@ -28,23 +117,66 @@ async def event_generator(
     # Send connection confirmation
     yield {
         "event": "connected",
-        "data": json.dumps({"status": "connected"}),
+        "data": _CONNECTED_DATA,
     }
 
+    subscriber = None
+    next_event = None
     try:
         subscriber = await get_event_subscriber()
+        events = subscriber.subscribe(organization_id).__aiter__()
+        loop = asyncio.get_running_loop()
+        # When a stats/events refresh is due, and the latest it may be
+        # pushed back to; None while nothing is pending
+        update_due = None
+        update_deadline = None
+        last_violation = None
+
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(events.__anext__())
+
+            timeout = None if update_due is None else max(0.0, update_due - loop.time())
+            await asyncio.wait({next_event}, timeout=timeout)
+
+            if update_due is not None and loop.time() >= update_due:
+                # Burst went quiet (or hit the max delay): push one refresh
+                # covering it; a ready event is handled on the next pass
+                update_due = update_deadline = None
+                try:
+                    updates = await shared_dashboard_updates(UUID(organization_id), last_violation)
+                except Exception:
+                    logger.exception("Dashboard refresh failed for organization %s", organization_id)
+                else:
+                    for update in updates:
+                        yield update
+                continue
+
+            try:
+                event_data = next_event.result()
+            except StopAsyncIteration:
+                break
+            finally:
+                next_event = None
 
-        async for event_data in subscriber.subscribe(organization_id):
             # Check if client disconnected
             if await request.is_disconnected():
                 break
 
             # Forward event to client
+            event_type = event_data.get("type", "message")
             yield {
-                "event": event_data.get("type", "message"),
-                "data": json.dumps(event_data.get("data", event_data)),
+                "event": event_type,
+                "data": _encode_data(event_data.get("data", event_data)),
             }
 
+            # Push the refreshed dashboard state once the violations settle
+            if event_type == "violation":
+                now = last_violation = loop.time()
+                if update_deadline is None:
+                    update_deadline = now + DASHBOARD_UPDATE_MAX_DELAY
+                update_due = min(now + DASHBOARD_UPDATE_DELAY, update_deadline)
+
     except asyncio.CancelledError:
         pass
     except Exception as e:
@@ -53,6 +185,8 @@ async def event_generator(
             "data": json.dumps({"error": str(e)}),
         }
     finally:
+        if next_event is not None:
+            next_event.cancel()
         if subscriber:
             await subscriber.unsubscribe()
 
@@ -69,7 +203,7 @@ async def heartbeat_generator(
     # Send connection confirmation
     yield {
         "event": "connected",
-        "data": json.dumps({"status": "connected", "mode": "polling"}),
+        "data": _CONNECTED_POLLING_DATA,
     }
 
     try:
@@ -81,7 +215,7 @@ async def heartbeat_generator(
             # Send heartbeat
             yield {
                 "event": "heartbeat",
-                "data": json.dumps({"status": "ok"}),
+                "data": _HEARTBEAT_DATA,
             }
 
             await asyncio.sleep(30)  # Heartbeat every 30 seconds
@@ -103,6 +237,10 @@ async def sse_events(
     Event types:
     - connected: Connection established
     - violation: Safety violation detected
+    - stats: Updated stats summary (sent once a burst of violations settles)
+    - events: Updated live events (sent once a burst of violations settles)
+    - camera_status: A camera's status changed (online, offline, error, ...)
+    - camera_fps: A camera's stream/inference frame rate changed
     - heartbeat: Keep-alive ping
     - error: Error occurred
     """
@@ -183,7 +321,7 @@ async def sse_camera_events(
                 if data.get("camera_id") == camera_id:
                     yield {
                         "event": event_data.get("type", "message"),
-                        "data": json.dumps(data),
+                        "data": _encode_data(data),
                     }
 
         except asyncio.CancelledError:
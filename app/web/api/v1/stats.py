@@ -1,5 +1,7 @@
 """Statistics API endpoints."""
 
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,15 +20,11 @@ from ...auth.dependencies import CurrentUser
 router = APIRouter()
 
 
-@router.get("/summary", response_model=StatsSummaryResponse)
-async def get_stats_summary(
-    auth: CurrentUser,
-    db: AsyncSession = Depends(get_db_session),
-):
-    """
-    Get summary statistics for the dashboard.
-    """
-    stats_repo = StatsRepository(db, auth.organization_id)
+async def build_stats_summary(
+    db: AsyncSession, organization_id: UUID
+) -> StatsSummaryResponse:
+    """Compute the dashboard summary for an organization."""
+    stats_repo = StatsRepository(db, organization_id)
 
     violations_today = await stats_repo.get_violations_today()
     violations_yesterday = await stats_repo.get_violations_yesterday()
@@ -54,6 +52,17 @@ async def get_stats_summary(
     )
 
 
+@router.get("/summary", response_model=StatsSummaryResponse)
+async def get_stats_summary(
+    auth: CurrentUser,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get summary statistics for the dashboard.
+    """
+    return await build_stats_summary(db, auth.organization_id)
+
+
 @router.get("/daily", response_model=DailyStatsResponse)
 async def get_daily_stats(
     auth: CurrentUser,
@@ -1,83 +1,224 @@
 """Video streaming API endpoints."""
 
 import asyncio
-from typing import Optional
+import logging
+import time
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+import cv2
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....shared.db.database import get_db_session
 from ....shared.db.repositories.cameras import CameraRepository
-from ....shared.redis.pubsub import get_frame_subscriber, get_shared_frame_broadcaster
+from ....shared.redis.client import get_redis
+from ....shared.redis.pubsub import (
+    CAMERA_ACCESS_INVALIDATION_CHANNEL,
+    get_frame_subscriber,
+    get_shared_frame_broadcaster,
+)
 from ...auth.dependencies import CurrentUser
 
+try:
+    import simplejpeg
+except ImportError:  # libjpeg-turbo wheel unavailable, fall back to OpenCV
+    simplejpeg = None
+
 router = APIRouter()
+logger = logging.getLogger("sva.web.stream")
+
+# MJPEG multipart framing around each JPEG part
+_MJPEG_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+_MJPEG_TRAILER = b"\r\n"
+
+# Response headers shared by every stream/snapshot response
+_MJPEG_MEDIA_TYPE = "multipart/x-mixed-replace; boundary=frame"
+_MJPEG_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+    # Frames must reach the client as they are written, not when a proxy's
+    # buffer fills (nginx honours this per response)
+    "X-Accel-Buffering": "no",
+}
+_JPEG_HEADERS = {"Cache-Control": "no-cache"}
+_PLACEHOLDER_HEADERS = {"Cache-Control": "public, max-age=86400, immutable"}
+_PLACEHOLDER_URL = "/api/v1/snapshot/placeholder.jpg"
+
+
+def _encode_jpeg(frame: np.ndarray, quality: int = 75) -> bytes:
+    """Encode a BGR frame as JPEG, preferring simplejpeg (libjpeg-turbo)."""
+    if simplejpeg is not None:
+        return simplejpeg.encode_jpeg(frame, quality=quality, colorspace="BGR")
+    _, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return jpeg.tobytes()
+
+
+def _render_placeholder_jpeg() -> bytes:
+    """Render the static "No Signal" placeholder frame as JPEG."""
+    # Create a dark frame with "No Signal" text
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame[:] = (30, 30, 40)  # Dark background
+
+    cv2.putText(
+        frame,
+        "No Signal",
+        (220, 230),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        1.5,
+        (100, 100, 100),
+        2,
+    )
+    cv2.putText(
+        frame,
+        "Waiting for video stream...",
+        (170, 270),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.6,
+        (80, 80, 80),
+        1,
+    )
 
+    return _encode_jpeg(frame)
 
-# Pre-generated placeholder JPEG (generated once at module load)
-_placeholder_jpeg: Optional[bytes] = None
 
+# Placeholder content is static, so encode it once at import
+_PLACEHOLDER_JPEG: bytes = _render_placeholder_jpeg()
+_PLACEHOLDER_CHUNK: bytes = b"".join((_MJPEG_HEADER, _PLACEHOLDER_JPEG, _MJPEG_TRAILER))
 
-def _get_placeholder_jpeg() -> bytes:
-    """Get or create cached placeholder JPEG."""
-    global _placeholder_jpeg
-    if _placeholder_jpeg is None:
-        import cv2
-        import numpy as np
 
-        # Create a dark frame with "No Signal" text
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        frame[:] = (30, 30, 40)  # Dark background
+# camera_id -> (frame, framed multipart chunk). The broadcaster hands every
+# viewer of a camera the same bytes object, so the first viewer to see a
+# frame frames it and the rest reuse that chunk instead of copying it again.
+# Entries are dropped when a camera's last viewer in this process leaves.
+_FRAMED_CHUNKS: Dict[str, Tuple[bytes, bytes]] = {}
+# camera_id -> open MJPEG streams in this process
+_STREAM_VIEWERS: Dict[str, int] = {}
 
-        cv2.putText(
-            frame,
-            "No Signal",
-            (220, 230),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1.5,
-            (100, 100, 100),
-            2,
-        )
-        cv2.putText(
-            frame,
-            "Waiting for video stream...",
-            (170, 270),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.6,
-            (80, 80, 80),
-            1,
-        )
 
-        _, jpeg = cv2.imencode(".jpg", frame)
-        _placeholder_jpeg = jpeg.tobytes()
-    return _placeholder_jpeg
+def _framed_chunk(camera_id: str, frame: bytes) -> bytes:
+    """Wrap a JPEG in multipart framing, once per frame for all viewers."""
+    cached = _FRAMED_CHUNKS.get(camera_id)
+    if cached is not None and cached[0] is frame:
+        return cached[1]
+    chunk = b"".join((_MJPEG_HEADER, frame, _MJPEG_TRAILER))
+    _FRAMED_CHUNKS[camera_id] = (frame, chunk)
+    return chunk
+
+
+# Recently verified camera ownership ((organization_id, camera_id) -> expiry).
+# Per process; deletes are broadcast on CAMERA_ACCESS_INVALIDATION_CHANNEL so
+# every worker drops the entry (see listen_for_camera_access_invalidations).
+CAMERA_ACCESS_TTL = 30.0
+CAMERA_ACCESS_CACHE_MAX_SIZE = 4096
+_CAMERA_ACCESS_CACHE: Dict[Tuple[UUID, UUID], float] = {}
+
 
+def _forget_camera_access(organization_id: UUID, camera_id: UUID) -> None:
+    _CAMERA_ACCESS_CACHE.pop((organization_id, camera_id), None)
+    _FRAMED_CHUNKS.pop(str(camera_id), None)
 
-async def generate_mjpeg_stream(camera_id: str):
+
+async def invalidate_camera_access(organization_id: UUID, camera_id: UUID) -> None:
+    """Forget a cached ownership check in every worker (call after a delete)."""
+    _forget_camera_access(organization_id, camera_id)
+    try:
+        redis = await get_redis()
+        await redis.publish(
+            CAMERA_ACCESS_INVALIDATION_CHANNEL, f"{organization_id}:{camera_id}"
+        )
+    except Exception:
+        pass  # Siblings fall back to CAMERA_ACCESS_TTL
+
+
+async def listen_for_camera_access_invalidations() -> None:
+    """Apply other workers' camera access invalidations until cancelled."""
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(CAMERA_ACCESS_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode()
+                    organization_id, _, camera_id = data.partition(":")
+                    try:
+                        _forget_camera_access(UUID(organization_id), UUID(camera_id))
+                    except ValueError:
+                        continue
+            finally:
+                await pubsub.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Camera access invalidation listener failed")
+        # Redis dropped or unavailable; entries still expire after the TTL
+        await asyncio.sleep(5.0)
+
+
+async def _camera_accessible(
+    db: AsyncSession,
+    organization_id: UUID,
+    camera_id: UUID,
+) -> bool:
+    """Check the camera belongs to the organization, caching hits for a TTL."""
+    key = (organization_id, camera_id)
+    now = time.monotonic()
+    expires_at = _CAMERA_ACCESS_CACHE.get(key)
+    if expires_at is not None and now < expires_at:
+        return True
+
+    camera_repo = CameraRepository(db, organization_id)
+    if not await camera_repo.exists(camera_id):
+        _CAMERA_ACCESS_CACHE.pop(key, None)
+        return False
+
+    _CAMERA_ACCESS_CACHE.pop(key, None)
+    if len(_CAMERA_ACCESS_CACHE) >= CAMERA_ACCESS_CACHE_MAX_SIZE:
+        # Oldest insertion first; refreshed entries were re-added at the end
+        del _CAMERA_ACCESS_CACHE[next(iter(_CAMERA_ACCESS_CACHE))]
+    _CAMERA_ACCESS_CACHE[key] = now + CAMERA_ACCESS_TTL
+    return True
+
+
+async def generate_mjpeg_stream(camera_id: str, max_fps: Optional[float] = None):
     """
     Generate MJPEG stream from Redis frames.
 
     Uses a shared broadcaster to reduce Redis connections when
     multiple clients watch the same camera.
 
+    Args:
+        camera_id: Camera identifier
+        max_fps: Drop frames arriving faster than this (None sends every frame)
+
     Yields:
         MJPEG frame bytes with boundary markers
     """
+    min_interval = 1.0 / max_fps if max_fps else 0.0
+    next_send = 0.0
+    _STREAM_VIEWERS[camera_id] = _STREAM_VIEWERS.get(camera_id, 0) + 1
     try:
         # Use shared broadcaster for efficient multi-client streaming
         broadcaster = await get_shared_frame_broadcaster()
 
         async for frame_data in broadcaster.subscribe(camera_id):
-            # MJPEG boundary format
-            yield b"--frame\r\n"
-            yield b"Content-Type: image/jpeg\r\n\r\n"
-            yield frame_data
-            yield b"\r\n"
-
-            # Small delay to prevent overwhelming
-            await asyncio.sleep(0.01)
+            if min_interval:
+                now = time.monotonic()
+                if now < next_send:
+                    continue
+                # Advance on schedule, so frames landing a hair early on an
+                # even source don't halve the rate; resync after a stall
+                next_send = max(next_send + min_interval, now)
+            # One chunk per frame: boundary, part headers, JPEG, trailer
+            yield _framed_chunk(camera_id, frame_data)
 
     except asyncio.CancelledError:
         # Client disconnected
@@ -85,25 +226,21 @@ async def generate_mjpeg_stream(camera_id: str):
     except Exception as e:
         # Log error but don't crash
         print(f"Stream error for camera {camera_id}: {e}")
-
-
-async def generate_placeholder_frame():
-    """Generate a placeholder frame when no video is available."""
-    return _get_placeholder_jpeg()
+    finally:
+        remaining = _STREAM_VIEWERS.pop(camera_id) - 1
+        if remaining:
+            _STREAM_VIEWERS[camera_id] = remaining
+        else:
+            # Don't keep the last frame of a camera nobody is watching
+            _FRAMED_CHUNKS.pop(camera_id, None)
 
 
 async def generate_placeholder_stream():
     """Generate a placeholder stream with periodic frame updates."""
     try:
-        # Use cached placeholder JPEG - no encoding needed
-        frame_data = _get_placeholder_jpeg()
-
+        # Pre-built multipart chunk - no encoding or framing per tick
         while True:
-            yield b"--frame\r\n"
-            yield b"Content-Type: image/jpeg\r\n\r\n"
-            yield frame_data
-            yield b"\r\n"
-
+            yield _PLACEHOLDER_CHUNK
             await asyncio.sleep(1.0)  # Update every second
 
     except asyncio.CancelledError:
@@ -114,18 +251,17 @@ async def generate_placeholder_stream():
 async def stream_camera(
     camera_id: UUID,
     auth: CurrentUser,
+    fps: Optional[float] = Query(default=None, gt=0, le=30),
     db: AsyncSession = Depends(get_db_session),
 ):
     """
     Stream video from a camera as MJPEG.
 
     The stream is fetched from Redis where the worker publishes frames.
+    Pass fps to cap the frame rate, e.g. for small thumbnails.
     """
     # Verify camera belongs to organization
-    camera_repo = CameraRepository(db, auth.organization_id)
-    camera = await camera_repo.get_by_id(camera_id)
-
-    if not camera:
+    if not await _camera_accessible(db, auth.organization_id, camera_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Camera not found",
@@ -139,13 +275,9 @@ async def stream_camera(
         if latest_frame:
             # Camera has active stream
             return StreamingResponse(
-                generate_mjpeg_stream(str(camera_id)),
-                media_type="multipart/x-mixed-replace; boundary=frame",
-                headers={
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache",
-                    "Expires": "0",
-                },
+                generate_mjpeg_stream(str(camera_id), fps),
+                media_type=_MJPEG_MEDIA_TYPE,
+                headers=_MJPEG_HEADERS,
             )
     except Exception:
         pass  # Redis not available or no frames
@@ -153,12 +285,20 @@ async def stream_camera(
     # Return placeholder stream
     return StreamingResponse(
         generate_placeholder_stream(),
-        media_type="multipart/x-mixed-replace; boundary=frame",
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        },
+        media_type=_MJPEG_MEDIA_TYPE,
+        headers=_MJPEG_HEADERS,
+    )
+
+
+@router.get("/snapshot/placeholder.jpg")
+async def get_placeholder_snapshot():
+    """
+    Static "No Signal" image, cacheable by browsers and any proxy in front.
+    """
+    return Response(
+        content=_PLACEHOLDER_JPEG,
+        media_type="image/jpeg",
+        headers=_PLACEHOLDER_HEADERS,
     )
 
 
@@ -172,10 +312,7 @@ async def get_snapshot(
     Get a single frame snapshot from a camera.
     """
     # Verify camera belongs to organization
-    camera_repo = CameraRepository(db, auth.organization_id)
-    camera = await camera_repo.get_by_id(camera_id)
-
-    if not camera:
+    if not await _camera_accessible(db, auth.organization_id, camera_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Camera not found",
@@ -187,18 +324,13 @@ async def get_snapshot(
         frame_data = await subscriber.get_latest_frame(str(camera_id))
 
         if frame_data:
-            return StreamingResponse(
-                iter([frame_data]),
+            return Response(
+                content=frame_data,
                 media_type="image/jpeg",
-                headers={"Cache-Control": "no-cache"},
+                headers=_JPEG_HEADERS,
             )
     except Exception:
         pass
 
-    # Return placeholder
-    placeholder = await generate_placeholder_frame()
-    return StreamingResponse(
-        iter([placeholder]),
-        media_type="image/jpeg",
-        headers={"Cache-Control": "no-cache"},
-    )
+    # Redirect to the cacheable placeholder so repeat polls skip Python
+    return RedirectResponse(url=_PLACEHOLDER_URL, status_code=307)
@@ -3,35 +3,40 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....shared.db.database import get_db_session
 from ....shared.db.models import User, UserRole
 from ....shared.db.repositories.users import UserRepository
-from ....shared.db.repositories.organizations import OrganizationRepository
 from ....shared.schemas.auth import (
     UserResponse,
     UserCreateRequest,
     UserUpdateRequest,
 )
-from ...auth import hash_password
-from ...auth.dependencies import AdminUser
+from ...auth import hash_password_async
+from ...auth.dependencies import AdminUser, invalidate_user_cache
 
 router = APIRouter()
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_user_list_adapter = TypeAdapter(List[UserResponse])
+
 
 @router.get("", response_model=List[UserResponse])
 async def list_users(
     auth: AdminUser,
     db: AsyncSession = Depends(get_db_session),
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
 ):
     """
-    List all users in the organization (admin only).
+    List users in the organization (admin only), paginated.
     """
     user_repo = UserRepository(db, auth.organization_id)
-    users, _ = await user_repo.get_all(limit=1000)
-    return [UserResponse.model_validate(u) for u in users]
+    users, _ = await user_repo.get_all(limit=limit, offset=offset)
+    return _user_list_adapter.validate_python(users, from_attributes=True)
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -44,29 +49,35 @@ async def create_user(
     Create a new user in the organization (admin only).
     """
     user_repo = UserRepository(db, auth.organization_id)
-    org_repo = OrganizationRepository(db)
+
+    # Email uniqueness and user limit in a single query
+    preflight = await user_repo.create_user_preflight(request.email)
+    if preflight is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found",
+        )
+    max_users, user_count, email_exists = preflight
 
     # Check email uniqueness within org
-    if await user_repo.email_exists(request.email):
+    if email_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exists in this organization",
         )
 
     # Check user limit
-    org = await org_repo.get_by_id(auth.organization_id)
-    user_count = await org_repo.get_user_count(auth.organization_id)
-    if user_count >= org.max_users:
+    if user_count >= max_users:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"User limit reached ({org.max_users}). Upgrade your plan.",
+            detail=f"User limit reached ({max_users}). Upgrade your plan.",
         )
 
     # Create user
     user = User(
         organization_id=auth.organization_id,
         email=request.email,
-        password_hash=hash_password(request.password),
+        password_hash=await hash_password_async(request.password),
         full_name=request.full_name,
         role=UserRole(request.role),
     )
@@ -137,6 +148,9 @@ async def update_user(
         user.is_active = request.is_active
 
     await user_repo.update(user)
+    # Commit first so no request can re-cache the old row in between
+    await db.commit()
+    invalidate_user_cache(user_id)
     return UserResponse.model_validate(user)
 
 
@@ -164,3 +178,6 @@ async def delete_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
+
+    await db.commit()
+    invalidate_user_cache(user_id)
@@ -0,0 +1,37 @@
+"""Static asset serving with content-hashed, long-lived URLs."""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from fastapi.staticfiles import StaticFiles
+
+STATIC_DIR = Path(__file__).parent / "static"
+STATIC_URL = "/static"
+
+# Asset URLs carry a content hash, so browsers may cache them forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Same, for per-tenant files that shared caches must not keep
+PRIVATE_IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+@lru_cache(maxsize=None)
+def asset_url(name: str) -> str:
+    """Get the URL for a static asset, versioned by a hash of its contents."""
+    digest = hashlib.blake2b(
+        (STATIC_DIR / name).read_bytes(), digest_size=8
+    ).hexdigest()
+    return f"{STATIC_URL}/{name}?v={digest}"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles that marks every served file as immutable."""
+
+    def __init__(self, *args, cache_control: str = IMMUTABLE_CACHE_CONTROL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = self.cache_control
+        return response
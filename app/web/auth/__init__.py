@@ -1,7 +1,12 @@
 """Authentication module."""
 
 from .jwt import create_access_token, decode_token
-from .password import hash_password, verify_password
+from .password import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+)
 from .dependencies import (
     get_current_user,
     get_current_active_user,
@@ -15,6 +20,8 @@ __all__ = [
     "decode_token",
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
     "get_current_user",
     "get_current_active_user",
     "require_admin",
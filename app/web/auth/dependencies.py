@@ -1,24 +1,38 @@
 """FastAPI authentication dependencies."""
 
-from typing import Annotated, Optional
+import time
+from typing import Annotated, Dict, Optional, Tuple
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...shared.db import get_db_session
-from ...shared.db.models import User, UserRole
+from ...shared.db.models import UserRole
 from ...shared.db.repositories.users import GlobalUserRepository
+from ...shared.schemas.auth import UserResponse
 from ..config import config
 from .jwt import decode_token, TokenData
 
 
+class AuthenticatedUser(UserResponse):
+    """Read-only copy of a User row, safe to share between requests."""
+    role: UserRole
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
+
 class AuthContext:
     """Authentication context with user and organization info."""
 
-    def __init__(self, user: User, token_data: TokenData):
+    def __init__(self, user: AuthenticatedUser, token_data: TokenData):
         self.user = user
         self.token_data = token_data
+        # Role checks resolved once; require_admin/require_manager just read them
+        self.is_admin: bool = user.role == UserRole.ADMIN
+        self.is_manager: bool = self.is_admin or user.role == UserRole.MANAGER
 
     @property
     def user_id(self) -> UUID:
@@ -32,13 +46,40 @@ class AuthContext:
     def role(self) -> UserRole:
         return self.user.role
 
-    @property
-    def is_admin(self) -> bool:
-        return self.user.role == UserRole.ADMIN
 
-    @property
-    def is_manager(self) -> bool:
-        return self.user.role in (UserRole.ADMIN, UserRole.MANAGER)
+# Short-lived cache of authenticated users (user_id -> (loaded_at, snapshot)).
+# Snapshots never touch a session, so a rollback or close in the request
+# that loaded them cannot expire them. The cache is per process; writers
+# invalidate after committing, and other workers catch up within the TTL.
+USER_CACHE_TTL = 5.0
+USER_CACHE_MAX_SIZE = 1024
+_USER_CACHE: Dict[UUID, Tuple[float, AuthenticatedUser]] = {}
+
+
+def invalidate_user_cache(user_id: UUID) -> None:
+    """Drop a cached user so the next request reloads it (call after commit)."""
+    _USER_CACHE.pop(user_id, None)
+
+
+async def _get_user_cached(db: AsyncSession, user_id: UUID) -> Optional[AuthenticatedUser]:
+    """Get a user by ID, reusing a recent lookup within USER_CACHE_TTL."""
+    now = time.monotonic()
+    cached = _USER_CACHE.get(user_id)
+    if cached is not None and now - cached[0] < USER_CACHE_TTL:
+        return cached[1]
+
+    user_repo = GlobalUserRepository(db)
+    row = await user_repo.get_by_id_global(user_id)
+    _USER_CACHE.pop(user_id, None)
+    if row is None:
+        return None
+
+    user = AuthenticatedUser.model_validate(row)
+    if len(_USER_CACHE) >= USER_CACHE_MAX_SIZE:
+        # Oldest insertion first; refreshed entries were re-added at the end
+        del _USER_CACHE[next(iter(_USER_CACHE))]
+    _USER_CACHE[user_id] = (now, user)
+    return user
 
 
 async def get_token_from_cookie(request: Request) -> Optional[str]:
@@ -78,9 +119,8 @@ async def get_current_user(
     if token_data.is_expired:
         raise credentials_exception
 
-    # Get user from database
-    user_repo = GlobalUserRepository(db)
-    user = await user_repo.get_by_id_global(token_data.user_id)
+    # Get user (cached for a few seconds to avoid a DB hit per request)
+    user = await _get_user_cached(db, token_data.user_id)
 
     if not user:
         raise credentials_exception
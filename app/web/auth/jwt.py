@@ -1,10 +1,15 @@
 """JWT token handling."""
 
+import functools
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
 
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
 
 from ..config import config
 
@@ -17,17 +22,38 @@ class TokenData:
         user_id: UUID,
         organization_id: UUID,
         role: str,
-        exp: datetime,
+        exp: float,
     ):
         self.user_id = user_id
         self.organization_id = organization_id
         self.role = role
-        self.exp = exp
+        self.exp = exp  # POSIX seconds, as carried in the JWT claim
 
     @property
     def is_expired(self) -> bool:
         """Check if token is expired."""
-        return datetime.utcnow() > self.exp
+        return time.time() > self.exp
+
+
+# HMAC key pre-encoded once; PyJWT's HS256 path runs through hashlib/OpenSSL,
+# which already dispatches to SHA-NI / ARMv8 SHA2 instructions where present
+_SIGNING_KEY: bytes = config.SECRET_KEY.encode("utf-8")
+
+# Decoded token cache (digest of raw token -> TokenData), FIFO-evicted
+_TOKEN_CACHE: Dict[bytes, TokenData] = {}
+_TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4096)
+def _uuid(value: str) -> UUID:
+    """Parse a UUID claim, memoized since the same IDs recur across tokens."""
+    return UUID(value)
+
+
+def _token_digest(token: str) -> bytes:
+    """Short digest of the raw token used as the cache key."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
 
 def create_access_token(
@@ -48,36 +74,60 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
+    now = datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=config.JWT_EXPIRE_MINUTES)
+        expire = now + timedelta(minutes=config.JWT_EXPIRE_MINUTES)
 
     payload = {
         "sub": str(user_id),
         "org": str(organization_id),
         "role": role,
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
     }
 
-    return jwt.encode(payload, config.SECRET_KEY, algorithm=config.JWT_ALGORITHM)
+    return jwt.encode(payload, _SIGNING_KEY, algorithm=config.JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> Optional[TokenData]:
     """
     Decode and validate a JWT token.
 
+    Verified tokens are cached by digest until they expire, so repeat
+    requests with the same cookie skip signature verification.
+
     Args:
         token: JWT token string
 
     Returns:
         TokenData if valid, None otherwise
     """
+    key = _token_digest(token)
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        if not cached.is_expired:
+            return cached
+        with _token_cache_lock:
+            _TOKEN_CACHE.pop(key, None)
+
+    token_data = _decode_token_uncached(token)
+    if token_data is not None:
+        with _token_cache_lock:
+            if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                _TOKEN_CACHE.pop(next(iter(_TOKEN_CACHE)), None)
+            _TOKEN_CACHE[key] = token_data
+    return token_data
+
+
+def _decode_token_uncached(token: str) -> Optional[TokenData]:
+    """Verify the signature and parse claims of a JWT token."""
     try:
         payload = jwt.decode(
             token,
-            config.SECRET_KEY,
+            _SIGNING_KEY,
             algorithms=[config.JWT_ALGORITHM],
         )
 
@@ -90,10 +140,10 @@ def decode_token(token: str) -> Optional[TokenData]:
             return None
 
         return TokenData(
-            user_id=UUID(user_id),
-            organization_id=UUID(organization_id),
+            user_id=_uuid(user_id),
+            organization_id=_uuid(organization_id),
             role=role,
-            exp=datetime.fromtimestamp(exp),
+            exp=float(exp),
         )
 
     except (JWTError, ValueError):
@@ -1,7 +1,18 @@
 """Password hashing utilities."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+# Dedicated pool for bcrypt so hashing neither blocks the event loop nor
+# competes with the default executor; bcrypt releases the GIL while hashing
+_PWD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt",
+)
+
 
 def hash_password(password: str) -> str:
     """
@@ -37,3 +48,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(password_bytes, hashed_bytes)
     except Exception:
         return False
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the dedicated bcrypt thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PWD_EXECUTOR, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the dedicated bcrypt thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _PWD_EXECUTOR, verify_password, plain_password, hashed_password
+    )
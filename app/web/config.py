@@ -3,46 +3,58 @@
 import os
 from typing import Optional
 
+# Bound once; every setting below is read a single time at import
+_env = os.environ.get
+
+_CORS_ORIGINS = _env("CORS_ORIGINS", "")
+_IS_PRODUCTION = (
+    _env("RAILWAY_ENVIRONMENT") is not None
+    or _env("ENVIRONMENT", "").lower() == "production"
+)
+
 
 class WebConfig:
     """Configuration for web service."""
 
     # Server
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8123"))
+    HOST: str = _env("HOST", "0.0.0.0")
+    PORT: int = int(_env("PORT", "8123"))
+    # Worker processes for main(); Dockerfile.web passes the same default.
+    # In-process caches (users, camera access) are only invalidated in the
+    # worker that made the change; their TTLs bound staleness elsewhere.
+    WORKERS: int = int(_env("WEB_CONCURRENCY", str(os.cpu_count() or 1) if _IS_PRODUCTION else "1"))
 
     # Security
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "CHANGE_ME_IN_PRODUCTION")
+    SECRET_KEY: str = _env("SECRET_KEY", "CHANGE_ME_IN_PRODUCTION")
     JWT_ALGORITHM: str = "HS256"
-    JWT_EXPIRE_MINUTES: int = int(os.getenv("JWT_EXPIRE_MINUTES", "60"))
+    JWT_EXPIRE_MINUTES: int = int(_env("JWT_EXPIRE_MINUTES", "60"))
 
     # Cookie settings
     COOKIE_NAME: str = "session"
-    COOKIE_SECURE: bool = os.getenv("COOKIE_SECURE", "true").lower() == "true"
+    COOKIE_SECURE: bool = _env("COOKIE_SECURE", "true").lower() == "true"
     COOKIE_HTTPONLY: bool = True
     COOKIE_SAMESITE: str = "strict"
 
     # CORS (for development)
-    CORS_ORIGINS: list = os.getenv("CORS_ORIGINS", "").split(",") if os.getenv("CORS_ORIGINS") else []
+    CORS_ORIGINS: list = _CORS_ORIGINS.split(",") if _CORS_ORIGINS else []
 
     # Rate limiting
-    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
-    RATE_LIMIT_AUTH: int = int(os.getenv("RATE_LIMIT_AUTH", "5"))  # per minute
-    RATE_LIMIT_API: int = int(os.getenv("RATE_LIMIT_API", "100"))  # per minute
+    RATE_LIMIT_ENABLED: bool = _env("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_AUTH: int = int(_env("RATE_LIMIT_AUTH", "5"))  # per minute
+    RATE_LIMIT_API: int = int(_env("RATE_LIMIT_API", "100"))  # per minute
 
     # Logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = _env("LOG_LEVEL", "INFO")
 
     # Features
-    REGISTRATION_ENABLED: bool = os.getenv("REGISTRATION_ENABLED", "true").lower() == "true"
-    MAX_CAMERAS_DEFAULT: int = int(os.getenv("MAX_CAMERAS_DEFAULT", "5"))
-    MAX_USERS_DEFAULT: int = int(os.getenv("MAX_USERS_DEFAULT", "3"))
+    REGISTRATION_ENABLED: bool = _env("REGISTRATION_ENABLED", "true").lower() == "true"
+    MAX_CAMERAS_DEFAULT: int = int(_env("MAX_CAMERAS_DEFAULT", "5"))
+    MAX_USERS_DEFAULT: int = int(_env("MAX_USERS_DEFAULT", "3"))
 
     @classmethod
     def is_production(cls) -> bool:
         """Check if running in production."""
-        return os.getenv("RAILWAY_ENVIRONMENT") is not None or \
-               os.getenv("ENVIRONMENT", "").lower() == "production"
+        return _IS_PRODUCTION
 
     @classmethod
     def validate(cls) -> list[str]:
@@ -3,85 +3,177 @@
 Build version: 20260119-0637
 """
 
+import asyncio
+import json
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 from pathlib import Path
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    RedirectResponse,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
+
+try:
+    import orjson
+except ImportError:  # Rust JSON encoder unavailable, fall back to stdlib json
+    orjson = None
 
-from ..shared.db.database import init_db, close_db
+from ..shared.db.database import init_db, close_db, get_db_session
 from ..shared.redis.client import close_redis
 from .api.v1 import router as api_router
+from .api.v1.stats import build_stats_summary
+from .api.v1.stream import listen_for_camera_access_invalidations
+from .assets import STATIC_DIR, STATIC_URL, PRIVATE_IMMUTABLE_CACHE_CONTROL, ImmutableStaticFiles
+from .auth.dependencies import get_current_user
 from .config import config
-from .dashboard import DASHBOARD_HTML, LOGIN_HTML, LIVE_HTML, CAMERA_SETUP_HTML
+from .pages import (
+    ALL_PAGES,
+    LOGIN_PAGE,
+    REGISTER_PAGE,
+    DASHBOARD_PAGE,
+    LIVE_PAGE,
+    CAMERA_SETUP_PAGE,
+    dashboard_response,
+)
+
+
+logger = logging.getLogger("sva.web")
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Route sva.web records through a queue to a stdout writer thread.
+
+    Every worker logs at startup; the queue keeps those writes off the
+    event loop and stops them interleaving mid-line.
+    """
+    log_queue = queue.SimpleQueue()
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter("[%(process)d] %(message)s"))
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(config.LOG_LEVEL.upper())
+    logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+    listener.start()
+    return listener
+
+
+# Set once a replica has confirmed the inline migrations, so siblings that
+# boot within the TTL skip the catalog queries entirely
+SCHEMA_MARKER_KEY = "schema:web:inference_enabled"
+SCHEMA_MARKER_TTL = 3600
+
+
+async def _run_inline_migrations() -> None:
+    """Add columns Alembic might miss, doing the work on only one replica."""
+    from sqlalchemy import text
+    from ..shared.db.database import async_session_factory
+    from ..shared.redis.client import get_redis
+
+    try:
+        redis = await get_redis()
+        if await redis.get(SCHEMA_MARKER_KEY):
+            logger.info("[SETUP] Schema up to date (cached)")
+            return
+    except Exception:
+        redis = None  # No Redis; fall through to the catalog check
+
+    check_column = text("""
+        SELECT column_name FROM information_schema.columns
+        WHERE table_name = 'cameras' AND column_name = 'inference_enabled'
+    """)
+    try:
+        async with async_session_factory() as session:
+            if not (await session.execute(check_column)).fetchone():
+                # Serialize replicas booting together; the loser re-checks
+                # after the winner commits and finds the column present
+                await session.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext('web_schema_migrations'))")
+                )
+                if not (await session.execute(check_column)).fetchone():
+                    logger.info("[SETUP] Adding inference_enabled column to cameras...")
+                    await session.execute(text("""
+                        ALTER TABLE cameras
+                        ADD COLUMN inference_enabled BOOLEAN NOT NULL DEFAULT true
+                    """))
+                    logger.info("[SETUP] Column added successfully")
+                await session.commit()
+            else:
+                logger.info("[SETUP] Schema up to date")
+    except Exception as e:
+        logger.warning("[WARN] Schema migration check failed: %s", e)
+        return
+
+    if redis is not None:
+        try:
+            await redis.set(SCHEMA_MARKER_KEY, "1", ex=SCHEMA_MARKER_TTL)
+        except Exception:
+            pass
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
-    print("=" * 60)
-    print("  Safety Video Analytics - Web Service")
-    print("  Multi-Tenant SaaS Platform")
-    print("=" * 60)
+    log_listener = _start_log_listener()
+    logger.info("Safety Video Analytics - Web Service (Multi-Tenant SaaS Platform)")
 
     # Validate configuration
     warnings = config.validate()
     for warning in warnings:
-        print(f"[WARN] {warning}")
+        logger.warning("[WARN] %s", warning)
 
     # Initialize database
-    print("\n[SETUP] Initializing database connection...")
+    logger.info("[SETUP] Initializing database connection...")
     await init_db()
 
     # Run inline migrations (for columns that Alembic might miss)
-    print("[SETUP] Checking schema migrations...")
-    try:
-        from sqlalchemy import text
-        from ..shared.db.database import async_session_factory
-        async with async_session_factory() as session:
-            # Add inference_enabled column if missing
-            result = await session.execute(text("""
-                SELECT column_name FROM information_schema.columns
-                WHERE table_name = 'cameras' AND column_name = 'inference_enabled'
-            """))
-            if not result.fetchone():
-                print("[SETUP] Adding inference_enabled column to cameras...")
-                await session.execute(text("""
-                    ALTER TABLE cameras
-                    ADD COLUMN inference_enabled BOOLEAN NOT NULL DEFAULT true
-                """))
-                await session.commit()
-                print("[SETUP] Column added successfully")
-            else:
-                print("[SETUP] Schema up to date")
-    except Exception as e:
-        print(f"[WARN] Schema migration check failed: {e}")
+    logger.info("[SETUP] Checking schema migrations...")
+    await _run_inline_migrations()
 
     # Check Redis
-    print("[SETUP] Checking Redis connection...")
+    logger.info("[SETUP] Checking Redis connection...")
     try:
         from ..shared.redis.client import get_redis
         redis = await get_redis()
         await redis.ping()
-        print("[SETUP] Redis connected")
+        logger.info("[SETUP] Redis connected")
     except Exception as e:
-        print(f"[WARN] Redis not available: {e}")
-        print("[WARN] SSE and streaming will use fallback mode")
+        logger.warning("[WARN] Redis not available: %s", e)
+        logger.warning("[WARN] SSE and streaming will use fallback mode")
 
-    print(f"\n[SERVER] Starting on port {config.PORT}...")
-    print(f"[SERVER] Production mode: {config.is_production()}")
-    print("=" * 60)
+    # Drop camera access checks that other workers invalidate
+    invalidation_listener = asyncio.create_task(listen_for_camera_access_invalidations())
+
+    # Encode and compress the dashboard pages before taking traffic
+    logger.info("[SETUP] Precompressing dashboard pages...")
+    for page in ALL_PAGES:
+        page.prepare()
+
+    logger.info("[SERVER] Starting on port %s (production mode: %s)", config.PORT, config.is_production())
 
     yield  # Application runs here
 
     # Shutdown
-    print("\n[SHUTDOWN] Closing connections...")
+    logger.info("[SHUTDOWN] Closing connections...")
+    invalidation_listener.cancel()
+    try:
+        await invalidation_listener
+    except asyncio.CancelledError:
+        pass
     await close_db()
     await close_redis()
-    print("[SHUTDOWN] Complete")
+    logger.info("[SHUTDOWN] Complete")
+    log_listener.stop()
 
 
 # Create FastAPI app
@@ -92,6 +184,8 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs" if not config.is_production() else None,
     redoc_url="/redoc" if not config.is_production() else None,
+    # API responses (camera lists, events) are rendered by orjson when available
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
 )
 
 # CORS middleware (for development)
@@ -107,79 +201,137 @@ if config.CORS_ORIGINS:
 # Mount thumbnails directory
 thumbnails_path = Path("data/thumbnails")
 thumbnails_path.mkdir(parents=True, exist_ok=True)
-app.mount("/thumbnails", StaticFiles(directory=str(thumbnails_path)), name="thumbnails")
+# Thumbnails are named by a fresh event UUID and never rewritten, so
+# browsers can keep them for good
+app.mount(
+    "/thumbnails",
+    ImmutableStaticFiles(
+        directory=str(thumbnails_path),
+        cache_control=PRIVATE_IMMUTABLE_CACHE_CONTROL,
+    ),
+    name="thumbnails",
+)
+
+# Mount versioned static assets (precompiled CSS etc.)
+app.mount(STATIC_URL, ImmutableStaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # Include API router
 app.include_router(api_router)
 
-# Legacy API routes (for backward compatibility)
-from fastapi import APIRouter
-legacy_router = APIRouter(prefix="/api")
-
-
-@legacy_router.get("/cameras")
-async def legacy_cameras(request: Request):
-    """Legacy camera endpoint - redirect to v1."""
-    return RedirectResponse(url="/api/v1/cameras", status_code=307)
-
-
-@legacy_router.get("/events/live")
-async def legacy_events(request: Request):
-    """Legacy events endpoint - redirect to v1."""
-    return RedirectResponse(url="/api/v1/events/live", status_code=307)
-
+# Legacy API paths (for backward compatibility), served by their v1
+# equivalents. Rewriting the path before routing costs a dict lookup
+# instead of a route match, a handler call and a client redirect.
+_LEGACY_API_PATHS = {
+    "/api/cameras": "/api/v1/cameras",
+    "/api/events/live": "/api/v1/events/live",
+    "/api/stats/summary": "/api/v1/stats/summary",
+    "/api/sse/events": "/api/v1/sse/events",
+}
+_LEGACY_STREAM_PREFIX = "/api/stream/"
+
+
+class LegacyAPIRewriteMiddleware:
+    """Map legacy /api/* GET paths onto /api/v1/* before routing."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            path = scope["path"]
+            new_path = _LEGACY_API_PATHS.get(path)
+            if new_path is None and path.startswith(_LEGACY_STREAM_PREFIX):
+                new_path = "/api/v1/stream/" + path[len(_LEGACY_STREAM_PREFIX):]
+            if new_path is not None:
+                scope = dict(scope, path=new_path, raw_path=new_path.encode())
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(LegacyAPIRewriteMiddleware)
+
+
+# Health check for Railway, answered before routing. The probe fires
+# constantly, so its response is encoded once and written as-is.
+_HEALTH_BODY = json.dumps(
+    {"status": "healthy", "service": "web", "version": app.version},
+    separators=(",", ":"),
+).encode()
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+
+
+class HealthCheckMiddleware:
+    """Serve GET /health without entering the router or other middleware."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["path"] == "/health"
+            and scope["method"] in ("GET", "HEAD")
+        ):
+            await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+            body = _HEALTH_BODY if scope["method"] == "GET" else b""
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app(scope, receive, send)
+
+
+# Added last so it is the outermost middleware
+app.add_middleware(HealthCheckMiddleware)
+
+
+# Service worker must be served from the root to control every page
+@app.get("/sw.js", include_in_schema=False)
+async def service_worker():
+    """Serve the dashboard service worker."""
+    return FileResponse(
+        STATIC_DIR / "sw.js",
+        media_type="application/javascript",
+        headers={"Cache-Control": "no-cache"},
+    )
 
-@legacy_router.get("/stats/summary")
-async def legacy_stats(request: Request):
-    """Legacy stats endpoint - redirect to v1."""
-    return RedirectResponse(url="/api/v1/stats/summary", status_code=307)
 
+# Dashboard routes
+class PageRedirect(Exception):
+    """Raised by page dependencies to send the browser elsewhere."""
 
-@legacy_router.get("/stream/{camera_id}")
-async def legacy_stream(camera_id: str, request: Request):
-    """Legacy stream endpoint - redirect to v1."""
-    return RedirectResponse(url=f"/api/v1/stream/{camera_id}", status_code=307)
+    def __init__(self, url: str):
+        self.url = url
 
 
-@legacy_router.get("/sse/events")
-async def legacy_sse(request: Request):
-    """Legacy SSE endpoint - redirect to v1."""
-    return RedirectResponse(url="/api/v1/sse/events", status_code=307)
+@app.exception_handler(PageRedirect)
+async def page_redirect_handler(request: Request, exc: PageRedirect):
+    # A bare redirect; HTTPException(302) would come back with a JSON body
+    return RedirectResponse(url=exc.url, status_code=status.HTTP_302_FOUND)
 
 
-app.include_router(legacy_router)
+async def require_session_cookie(request: Request) -> None:
+    """Send visitors without a session cookie to the login page."""
+    if not request.cookies.get(config.COOKIE_NAME):
+        raise PageRedirect("/login")
 
 
-# Health check
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for Railway."""
-    return {
-        "status": "healthy",
-        "service": "web",
-        "version": "2.0.0",
-    }
+async def redirect_if_signed_in(request: Request) -> None:
+    """Send visitors who already have a session cookie to the dashboard."""
+    if request.cookies.get(config.COOKIE_NAME):
+        raise PageRedirect("/dashboard")
 
 
-# Dashboard routes
-@app.get("/", response_class=HTMLResponse)
-async def root(request: Request):
+@app.get("/", response_class=HTMLResponse, dependencies=[Depends(redirect_if_signed_in)])
+async def root():
     """Redirect to dashboard or login."""
-    # Check if user is authenticated via cookie
-    token = request.cookies.get(config.COOKIE_NAME)
-    if token:
-        return RedirectResponse(url="/dashboard", status_code=302)
     return RedirectResponse(url="/login", status_code=302)
 
 
-@app.get("/login", response_class=HTMLResponse)
+@app.get("/login", response_class=HTMLResponse, dependencies=[Depends(redirect_if_signed_in)])
 async def login_page(request: Request):
     """Serve the login page."""
-    # If already authenticated, redirect to dashboard
-    token = request.cookies.get(config.COOKIE_NAME)
-    if token:
-        return RedirectResponse(url="/dashboard", status_code=302)
-    return HTMLResponse(content=LOGIN_HTML)
+    return LOGIN_PAGE.response(request)
 
 
 @app.get("/register", response_class=HTMLResponse)
@@ -187,56 +339,58 @@ async def register_page(request: Request):
     """Serve the registration page."""
     if not config.REGISTRATION_ENABLED:
         return RedirectResponse(url="/login", status_code=302)
-    # Reuse login page with register mode
-    return HTMLResponse(content=LOGIN_HTML.replace(
-        '"login"',
-        '"register"'
-    ).replace(
-        'id="auth-mode" value="login"',
-        'id="auth-mode" value="register"'
-    ))
-
-
-@app.get("/dashboard", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Serve the dashboard page."""
-    # Check authentication
-    token = request.cookies.get(config.COOKIE_NAME)
-    if not token:
-        return RedirectResponse(url="/login", status_code=302)
-    return HTMLResponse(content=DASHBOARD_HTML)
+    return REGISTER_PAGE.response(request)
 
 
-@app.get("/live", response_class=HTMLResponse)
+@app.get("/dashboard", response_class=HTMLResponse, dependencies=[Depends(require_session_cookie)])
+async def dashboard(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Serve the dashboard page."""
+    # Render the stat cards server-side so they paint with real numbers;
+    # fall back to the static page, which loads them itself
+    try:
+        auth = await get_current_user(request, db)
+        stats = await build_stats_summary(db, auth.organization_id)
+    except HTTPException:
+        # Bad or expired cookie; the page's own API calls send it to /login
+        return DASHBOARD_PAGE.response(request)
+    except Exception:
+        logger.exception("Dashboard prerender failed; serving the static page")
+        return DASHBOARD_PAGE.response(request)
+    return dashboard_response(request, stats)
+
+
+@app.get("/live", response_class=HTMLResponse, dependencies=[Depends(require_session_cookie)])
 async def live_view(request: Request):
     """Serve the live view page."""
-    # Check authentication
-    token = request.cookies.get(config.COOKIE_NAME)
-    if not token:
-        return RedirectResponse(url="/login", status_code=302)
-    return HTMLResponse(content=LIVE_HTML)
+    return LIVE_PAGE.response(request)
 
 
-@app.get("/cameras/setup", response_class=HTMLResponse)
+@app.get("/cameras/setup", response_class=HTMLResponse, dependencies=[Depends(require_session_cookie)])
 async def camera_setup(request: Request):
     """Serve the camera setup page."""
-    # Check authentication
-    token = request.cookies.get(config.COOKIE_NAME)
-    if not token:
-        return RedirectResponse(url="/login", status_code=302)
-    return HTMLResponse(content=CAMERA_SETUP_HTML)
+    return CAMERA_SETUP_PAGE.response(request)
 
 
 def main():
     """Main entry point."""
     import uvicorn
 
+    reload = not config.is_production()
     uvicorn.run(
         "app.web.main:app",
         host=config.HOST,
         port=config.PORT,
-        reload=not config.is_production(),
+        reload=reload,
+        # The reloader runs a single process and ignores extra workers
+        workers=1 if reload else config.WORKERS,
         log_level=config.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools",
+        # Outlive the dashboard's 5s polling so it keeps reusing connections
+        timeout_keep_alive=75,
     )
 
 
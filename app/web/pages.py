@@ -0,0 +1,162 @@
+"""Prebuilt HTML page responses for the dashboard routes."""
+
+import gzip
+import hashlib
+from functools import lru_cache
+from typing import Callable, FrozenSet
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .dashboard import (
+    login_html,
+    register_html,
+    dashboard_html,
+    render_dashboard_html,
+    live_html,
+    camera_setup_html,
+)
+
+PAGE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+# Signed-in page shells carry no user data but sit behind the session
+# cookie; a short private max-age lets in-app and back/forward navigation
+# reuse the browser's copy without a round-trip
+SIGNED_IN_PAGE_CACHE_CONTROL = "private, max-age=60"
+# Pages carrying per-user data must not be stored by shared caches
+PRIVATE_PAGE_CACHE_CONTROL = "private, no-cache"
+
+
+# Browsers send a handful of distinct Accept-Encoding values, so parse each once
+@lru_cache(maxsize=64)
+def _accepted_encodings(header: str) -> FrozenSet[str]:
+    """Parse an Accept-Encoding header into the codings with a non-zero q."""
+    accepted = set()
+    for part in header.lower().split(","):
+        coding, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+    return frozenset(accepted)
+
+
+# ETag suffix for each precompressed representation
+_ETAG_SUFFIXES = {"br": "br", "gzip": "gz"}
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if header.strip() == "*":
+        return True
+    # Proxies that recompress the body may hand back a weak W/ validator
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in header.split(",")
+    )
+
+
+class HTMLPage:
+    """An immutable HTML body, precompressed and hashed on first request."""
+
+    __slots__ = ("_render", "cache_control", "vary", "body", "_variants")
+
+    def __init__(
+        self,
+        render: Callable[[], str],
+        cache_control: str = PAGE_CACHE_CONTROL,
+    ):
+        self._render = render
+        self.cache_control = cache_control
+        # Private pages depend on the session cookie as well as the encoding
+        self.vary = (
+            "Accept-Encoding"
+            if cache_control == PAGE_CACHE_CONTROL
+            else "Accept-Encoding, Cookie"
+        )
+        self.body = None
+
+    def _build(self) -> None:
+        body = self._render().encode("utf-8")
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        encoded = {None: body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(body, quality=11)
+
+        # Content-coding -> (body, headers, 304 headers). Each encoding is
+        # its own representation, so each gets its own strong ETag. Header
+        # sets are fixed per page, so they are built once here; each
+        # response still gets its own copy, since middleware may add to it
+        self._variants = {}
+        for coding, content in encoded.items():
+            not_modified_headers = {
+                "ETag": f'"{digest}-{_ETAG_SUFFIXES[coding]}"' if coding else f'"{digest}"',
+                "Vary": self.vary,
+                # Once stale, unchanged pages come back as an empty 304
+                "Cache-Control": self.cache_control,
+            }
+            headers = (
+                {**not_modified_headers, "Content-Encoding": coding}
+                if coding else not_modified_headers
+            )
+            self._variants[coding] = (content, headers, not_modified_headers)
+        self.body = body
+
+    def prepare(self) -> None:
+        """Build the page now, so the first request doesn't pay for it."""
+        if self.body is None:
+            self._build()
+
+    def response(self, request: Request) -> Response:
+        """Serve the page in the best encoding the client accepts.
+
+        Returns 304 if the client already has this version.
+        """
+        self.prepare()
+
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        if "br" in accepted and "br" in self._variants:
+            coding = "br"
+        elif "gzip" in accepted:
+            coding = "gzip"
+        else:
+            coding = None
+        content, headers, not_modified_headers = self._variants[coding]
+
+        if _etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+            return Response(status_code=304, headers=not_modified_headers)
+        return HTMLResponse(content=content, headers=headers)
+
+
+LOGIN_PAGE = HTMLPage(login_html)
+REGISTER_PAGE = HTMLPage(register_html)
+DASHBOARD_PAGE = HTMLPage(dashboard_html)
+LIVE_PAGE = HTMLPage(live_html, SIGNED_IN_PAGE_CACHE_CONTROL)
+CAMERA_SETUP_PAGE = HTMLPage(camera_setup_html, SIGNED_IN_PAGE_CACHE_CONTROL)
+
+ALL_PAGES = (LOGIN_PAGE, REGISTER_PAGE, DASHBOARD_PAGE, LIVE_PAGE, CAMERA_SETUP_PAGE)
+
+
+def dashboard_response(request: Request, stats) -> Response:
+    """Serve the dashboard with the caller's stats already in the cards."""
+    body = render_dashboard_html(stats)
+    headers = {
+        "Vary": "Accept-Encoding",
+        "Cache-Control": PRIVATE_PAGE_CACHE_CONTROL,
+    }
+    # Compressed per request, so favour fast settings over the maximum ratio
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    if brotli is not None and "br" in accepted:
+        headers["Content-Encoding"] = "br"
+        body = brotli.compress(body, quality=4)
+    elif "gzip" in accepted:
+        headers["Content-Encoding"] = "gzip"
+        body = gzip.compress(body, compresslevel=6, mtime=0)
+    return HTMLResponse(content=body, headers=headers)
@@ -0,0 +1,265 @@
+// Look up the page's elements once
+const $ = id => document.getElementById(id);
+const els = {
+    cameraList: $('camera-list'),
+    cameraModal: $('camera-modal'),
+    modalTitle: $('modal-title'),
+    modalError: $('modal-error'),
+    cameraId: $('camera-id'),
+    cameraName: $('camera-name'),
+    cameraZone: $('camera-zone'),
+    sourceType: $('source-type'),
+    rtspFields: $('rtsp-fields'),
+    fileFields: $('file-fields'),
+    rtspUrl: $('rtsp-url'),
+    rtspUser: $('rtsp-user'),
+    rtspPass: $('rtsp-pass'),
+    placeholderUrl: $('placeholder-url'),
+    targetFps: $('target-fps'),
+    detectionMode: $('detection-mode'),
+    confidence: $('confidence'),
+    confValue: $('conf-value'),
+    inferenceEnabled: $('inference-enabled'),
+};
+
+async function fetchCameras(priority = 'auto', cache = 'default') {
+    try {
+        const response = await api('/api/v1/cameras', { priority, cache, signal: supersede('cameras') });
+        const data = await response.json();
+        renderCameras(data.cameras);
+    } catch (e) {
+        if (!isAbort(e)) console.error('Failed to fetch cameras:', e);
+    }
+}
+
+const STATUS_BADGE_CLASSES = {
+    online: 'bg-green-500/20 text-green-400',
+    error: 'bg-red-500/20 text-red-400',
+};
+
+const emptyListTemplate = template(`
+    <div class="col-span-full text-center py-12">
+        <svg class="w-16 h-16 text-gray-600 mx-auto mb-4" fill="currentColor"><use href="${ICON_SPRITE_URL}#icon-camera"/></svg>
+        <p class="text-gray-400 mb-4">No cameras configured yet</p>
+        <button onclick="showAddModal()" class="bg-accent text-dark-900 px-6 py-2 rounded-lg font-medium hover:bg-accent/90 transition">Add Your First Camera</button>
+    </div>
+`);
+
+const cameraCardTemplate = template(`
+    <div class="camera-card rounded-xl p-4 transition">
+        <div class="flex items-start justify-between mb-3">
+            <div>
+                <h3 class="font-semibold" data-role="name"></h3>
+                <p class="text-sm text-gray-400" data-role="zone"></p>
+            </div>
+            <div class="flex gap-2">
+                <span class="px-2 py-1 text-xs rounded bg-yellow-500/20 text-yellow-400" data-role="ai-off" hidden>AI Off</span>
+                <span data-role="status"></span>
+            </div>
+        </div>
+        <div class="text-sm text-gray-400 space-y-1 mb-4">
+            <p data-role="source"></p>
+            <p data-role="mode"></p>
+            <p data-role="fps"></p>
+            <p data-role="ai"></p>
+            <p class="text-red-400" data-role="error" hidden></p>
+        </div>
+        <div class="flex gap-2">
+            <button data-action="edit" class="flex-1 bg-dark-700 text-white px-3 py-2 rounded-lg text-sm hover:bg-dark-600 transition">Edit</button>
+            <button data-action="delete" class="bg-red-500/20 text-red-400 px-3 py-2 rounded-lg text-sm hover:bg-red-500/30 transition">Delete</button>
+        </div>
+    </div>
+`);
+
+const cameraNodes = new Map();
+
+function createCameraCard(cam) {
+    const root = cameraCardTemplate.cloneNode(true);
+    root.dataset.cameraId = cam.id;
+    const role = (name) => root.querySelector(`[data-role="${name}"]`);
+    return {
+        root,
+        name: role('name'),
+        zone: role('zone'),
+        aiOff: role('ai-off'),
+        status: role('status'),
+        source: role('source'),
+        mode: role('mode'),
+        fps: role('fps'),
+        ai: role('ai'),
+        error: role('error'),
+    };
+}
+
+function updateCameraCard(node, cam) {
+    node.camera = cam;
+    const aiEnabled = cam.inference_enabled !== false;
+    setText(node.name, cam.name);
+    setText(node.zone, cam.zone);
+    node.aiOff.hidden = aiEnabled;
+    const statusClass = `px-2 py-1 text-xs rounded ${STATUS_BADGE_CLASSES[cam.status] || 'bg-gray-500/20 text-gray-400'}`;
+    if (node.status.className !== statusClass) node.status.className = statusClass;
+    setText(node.status, cam.status);
+    setText(node.source, `Source: ${cam.source_type}`);
+    setText(node.mode, `Mode: ${cam.detection_mode}`);
+    setText(node.fps, `FPS: ${cam.target_fps}`);
+    setText(node.ai, `AI: ${aiEnabled ? 'Enabled' : 'Disabled'}`);
+    node.error.hidden = !cam.error_message;
+    setText(node.error, cam.error_message ? `Error: ${cam.error_message}` : '');
+}
+
+// One listener serves the Edit/Delete buttons of every card
+els.cameraList.addEventListener('click', (e) => {
+    const button = e.target.closest('button[data-action]');
+    const card = button?.closest('[data-camera-id]');
+    if (!card) return;
+    if (button.dataset.action === 'edit') editCamera(card.dataset.cameraId);
+    else deleteCamera(card.dataset.cameraId);
+});
+
+function renderCameras(cameras) {
+    const list = els.cameraList;
+    if (cameras.length === 0) {
+        cameraNodes.clear();
+        list.replaceChildren(emptyListTemplate.cloneNode(true));
+        return;
+    }
+    reconcile(list, cameras, cameraNodes, createCameraCard, updateCameraCard);
+}
+
+// Mirror the confidence slider into its label at most once per frame
+let confidenceFrame = 0;
+els.confidence.addEventListener('input', () => {
+    if (confidenceFrame) return;
+    confidenceFrame = requestAnimationFrame(() => {
+        confidenceFrame = 0;
+        setText(els.confValue, els.confidence.value);
+    });
+});
+
+function toggleSourceFields() {
+    const type = els.sourceType.value;
+    els.rtspFields.classList.toggle('hidden', type !== 'rtsp');
+    els.fileFields.classList.toggle('hidden', type !== 'file');
+}
+
+function showAddModal() {
+    els.modalTitle.textContent = 'Add Camera';
+    els.cameraId.value = '';
+    els.cameraName.value = '';
+    els.cameraZone.value = '';
+    els.sourceType.value = 'rtsp';
+    els.rtspUrl.value = '';
+    els.rtspUser.value = '';
+    els.rtspPass.value = '';
+    els.placeholderUrl.value = '';
+    els.targetFps.value = '0.5';
+    els.detectionMode.value = 'ppe';
+    els.confidence.value = '0.25';
+    els.confValue.textContent = '0.25';
+    els.inferenceEnabled.checked = true;
+    toggleSourceFields();
+    els.cameraModal.classList.remove('hidden');
+    els.cameraModal.classList.add('flex');
+}
+
+async function editCamera(id) {
+    const response = await api(`/api/v1/cameras/${id}`);
+    const cam = await response.json();
+
+    els.modalTitle.textContent = 'Edit Camera';
+    els.cameraId.value = cam.id;
+    els.cameraName.value = cam.name;
+    els.cameraZone.value = cam.zone;
+    els.sourceType.value = cam.source_type;
+    els.rtspUrl.value = cam.rtsp_url || '';
+    els.placeholderUrl.value = cam.placeholder_video || '';
+    els.targetFps.value = cam.target_fps.toString();
+    els.detectionMode.value = cam.detection_mode;
+    els.confidence.value = cam.confidence_threshold;
+    els.confValue.textContent = cam.confidence_threshold;
+    els.inferenceEnabled.checked = cam.inference_enabled !== false;
+    toggleSourceFields();
+    els.cameraModal.classList.remove('hidden');
+    els.cameraModal.classList.add('flex');
+}
+
+function hideModal() {
+    els.cameraModal.classList.add('hidden');
+    els.cameraModal.classList.remove('flex');
+    els.modalError.classList.add('hidden');
+}
+
+async function saveCamera() {
+    const id = els.cameraId.value;
+    const sourceType = els.sourceType.value;
+
+    const data = {
+        name: els.cameraName.value,
+        zone: els.cameraZone.value,
+        source_type: sourceType,
+        target_fps: parseFloat(els.targetFps.value),
+        detection_mode: els.detectionMode.value,
+        confidence_threshold: parseFloat(els.confidence.value),
+        inference_enabled: els.inferenceEnabled.checked,
+    };
+
+    if (sourceType === 'rtsp') {
+        data.rtsp_url = els.rtspUrl.value;
+        const user = els.rtspUser.value;
+        const pass = els.rtspPass.value;
+        if (user && pass) {
+            data.credentials = `${user}:${pass}`;
+        }
+    } else {
+        data.use_placeholder = true;
+        data.placeholder_video = els.placeholderUrl.value || null;
+    }
+
+    try {
+        const url = id ? `/api/v1/cameras/${id}` : '/api/v1/cameras';
+        const method = id ? 'PATCH' : 'POST';
+        const response = await api(url, { method, body: JSON.stringify(data) });
+
+        if (!response.ok) {
+            const error = await response.json();
+            els.modalError.textContent = error.detail || 'Failed to save camera';
+            els.modalError.classList.remove('hidden');
+            return;
+        }
+
+        hideModal();
+        fetchCameras();
+    } catch (e) {
+        els.modalError.textContent = 'Network error';
+        els.modalError.classList.remove('hidden');
+    }
+}
+
+async function deleteCamera(id) {
+    if (!confirm('Are you sure you want to delete this camera?')) return;
+
+    try {
+        await api(`/api/v1/cameras/${id}`, { method: 'DELETE' });
+        fetchCameras();
+    } catch (e) {
+        console.error('Failed to delete camera:', e);
+    }
+}
+
+// Status changes are pushed by the worker; patch just that card
+function applyCameraStatus(data) {
+    const node = cameraNodes.get(data.camera_id);
+    if (!node) return;
+    updateCameraCard(node, { ...node.camera, status: data.status, error_message: data.error_message });
+}
+
+subscribeEvents({
+    camera_status: applyCameraStatus,
+    // Catch up on anything missed while the stream was reconnecting
+    connected: (data, reconnect) => {
+        if (reconnect) fetchCameras('auto', 'no-cache');
+    },
+});
+
+fetchCameras('high');
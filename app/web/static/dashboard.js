@@ -0,0 +1,268 @@
+const $ = id => document.getElementById(id);
+// Stats summary rendered into the page by the server, or null
+const initialStats = JSON.parse($('initial-stats').textContent);
+
+const els = {
+    datetime: $('datetime'),
+    userInfo: $('user-info'),
+    violationsCount: $('violations-count'),
+    violationsChange: $('violations-change'),
+    activeCameras: $('active-cameras'),
+    totalCameras: $('total-cameras'),
+    aiScanned: $('ai-scanned'),
+    cameraGrid: $('camera-grid'),
+    activityFeed: $('activity-feed'),
+    toastContainer: $('toast-container'),
+};
+
+startClock(els.datetime);
+
+// Fetch several dashboard sections in one request
+const idle = window.requestIdleCallback || ((cb) => setTimeout(cb, 1));
+
+// deferSecondary renders the user name and activity feed in idle time,
+// so the first paint only waits on the stat cards and camera grid
+let lastCamerasText = null;
+
+function isCameraPoll(sections) {
+    return sections.cameras && !sections.user && !sections.stats && !sections.events;
+}
+
+async function fetchBootstrap(sections = { user: true, stats: true, cameras: true, events: true }, deferSecondary = false) {
+    try {
+        const params = new URLSearchParams();
+        for (const name of ['user', 'stats', 'cameras', 'events']) {
+            params.set(name, sections[name] ? 'true' : 'false');
+        }
+        // The first load is on the critical path; later refreshes are background work
+        const priority = deferSecondary ? 'high' : 'low';
+        const signal = supersede(`bootstrap?${params}`);
+        const response = await api(`/api/v1/dashboard/bootstrap?${params}`, { priority, signal });
+        if (!response || !response.ok) return;
+        const text = await response.text();
+        // The camera poll usually returns exactly what is already on screen
+        if (isCameraPoll(sections)) {
+            if (text === lastCamerasText) return;
+            lastCamerasText = text;
+        }
+        const data = JSON.parse(text);
+
+        if (data.stats) renderStats(data.stats);
+        if (data.cameras) renderCameras(data.cameras);
+
+        const renderSecondary = () => {
+            if (data.user) renderUser(data.user);
+            if (data.events) renderEvents(data.events);
+        };
+        if (deferSecondary) idle(renderSecondary);
+        else renderSecondary();
+    } catch (e) {
+        if (!isAbort(e)) console.error('Failed to fetch dashboard:', e);
+    }
+}
+
+function renderUser(user) {
+    els.userInfo.textContent = user.full_name;
+}
+
+// Formatters are costly to build, so each is created once and reused
+const countFormat = new Intl.NumberFormat();
+const eventTimeFormat = new Intl.DateTimeFormat(undefined, {
+    hour: 'numeric', minute: '2-digit', second: '2-digit'
+});
+
+function renderStats(data) {
+    els.violationsCount.textContent = data.violations_today;
+    els.activeCameras.textContent = data.active_cameras;
+    els.totalCameras.textContent = data.total_cameras;
+    els.aiScanned.textContent = countFormat.format(data.ai_scanned);
+
+    const changeEl = els.violationsChange;
+    if (data.violations_change_percent > 0) {
+        changeEl.textContent = `+${data.violations_change_percent}% from yesterday`;
+        changeEl.className = 'text-sm text-red-400 mt-1';
+    } else if (data.violations_change_percent < 0) {
+        changeEl.textContent = `${data.violations_change_percent}% from yesterday`;
+        changeEl.className = 'text-sm text-green-400 mt-1';
+    } else {
+        changeEl.textContent = 'Same as yesterday';
+        changeEl.className = 'text-sm text-gray-400 mt-1';
+    }
+}
+
+const cameraNodes = new Map();
+const cameraCardTemplate = template(`
+    <div class="camera-feed relative">
+        <img class="w-full aspect-video object-cover bg-dark-900" loading="lazy" decoding="async">
+        <div class="absolute top-2 left-2 flex items-center gap-2">
+            <span data-role="zone"></span>
+        </div>
+        <div class="absolute bottom-2 left-2 right-2 flex justify-between items-center">
+            <span class="text-sm font-medium" data-role="name"></span>
+            <span class="text-xs text-gray-400" data-role="fps"></span>
+        </div>
+    </div>
+`);
+
+// Grid thumbnails are small, so a lower frame rate cuts stream bandwidth
+// without a visible difference; the live view keeps the full rate
+const THUMBNAIL_STREAM_FPS = 5;
+
+function createCameraCard(cam) {
+    const root = cameraCardTemplate.cloneNode(true);
+    root.dataset.cameraId = cam.id;
+    const img = root.querySelector('img');
+    observeStream(img, `/api/v1/stream/${cam.id}?fps=${THUMBNAIL_STREAM_FPS}`);
+    return {
+        root,
+        img,
+        zone: root.querySelector('[data-role="zone"]'),
+        name: root.querySelector('[data-role="name"]'),
+        fps: root.querySelector('[data-role="fps"]'),
+        destroy: () => unobserveStream(img),
+    };
+}
+
+function updateCameraCard(node, cam) {
+    node.img.alt = cam.name;
+    node.zone.className = `zone-tag zone-${cam.zone.toLowerCase()}`;
+    setText(node.zone, cam.zone);
+    setText(node.name, cam.name);
+    setText(node.fps, cam.fps_display);
+}
+
+function renderCameras(data) {
+    const grid = els.cameraGrid;
+    if (data.cameras.length === 0) {
+        clearNodes(cameraNodes);
+        emptyMessage(grid, 'No cameras configured', 'text-gray-500 col-span-2 text-center py-8');
+        return;
+    }
+    reconcile(grid, data.cameras, cameraNodes, createCameraCard, updateCameraCard);
+}
+
+// Fetch events
+async function fetchEvents() {
+    try {
+        const response = await api('/api/v1/events/live?limit=10', { signal: supersede('events') });
+        if (!response || !response.ok) return;
+        renderEvents(await response.json());
+    } catch (e) {
+        if (!isAbort(e)) console.error('Failed to fetch events:', e);
+    }
+}
+
+const eventNodes = new Map();
+const eventItemTemplate = template(`
+    <div class="event-item">
+        <div class="flex items-start gap-3">
+            <div class="w-8 h-8 bg-red-500/20 rounded flex items-center justify-center flex-shrink-0">
+                <svg class="w-4 h-4 text-red-500" fill="currentColor"><use href="${ICON_SPRITE_URL}#icon-warning"/></svg>
+            </div>
+            <div class="flex-1 min-w-0">
+                <p class="text-sm font-medium" data-role="message"></p>
+                <p class="text-xs text-gray-500" data-role="time"></p>
+            </div>
+        </div>
+    </div>
+`);
+
+function createEventItem(event) {
+    const root = eventItemTemplate.cloneNode(true);
+    root.classList.add(event.severity);
+    root.querySelector('[data-role="message"]').textContent = event.message;
+    root.querySelector('[data-role="time"]').textContent = eventTimeFormat.format(new Date(event.timestamp));
+    return { root };
+}
+
+function renderEvents(data) {
+    const feed = els.activityFeed;
+    if (data.events.length === 0) {
+        clearNodes(eventNodes);
+        emptyMessage(feed, 'No recent events', 'text-gray-500 text-center py-8');
+        return;
+    }
+    // Events are immutable once created, so there is nothing to update
+    reconcile(feed, data.events, eventNodes, createEventItem, () => {});
+}
+
+// Acknowledge all
+async function acknowledgeAll() {
+    await api('/api/v1/events/acknowledge-all', { method: 'POST', keepalive: true });
+    fetchEvents();
+}
+
+// Toasts rotate through a small pool of prebuilt nodes instead of
+// parsing fresh markup for every violation
+const TOAST_POOL_SIZE = 3;
+const toastTemplate = template(`
+    <div class="toast" hidden>
+        <div class="flex items-center gap-3">
+            <svg class="w-5 h-5" fill="currentColor"><use href="${ICON_SPRITE_URL}#icon-warning"/></svg>
+            <span></span>
+        </div>
+    </div>
+`);
+const toastPool = Array.from({ length: TOAST_POOL_SIZE }, () => {
+    const root = toastTemplate.cloneNode(true);
+    els.toastContainer.appendChild(root);
+    return { root, message: root.querySelector('span'), timer: 0 };
+});
+let nextToast = 0;
+
+// Show toast
+function showToast(message) {
+    const toast = toastPool[nextToast];
+    nextToast = (nextToast + 1) % TOAST_POOL_SIZE;
+    toast.message.textContent = message;
+    toast.root.hidden = false;
+    clearTimeout(toast.timer);
+    toast.timer = setTimeout(() => { toast.root.hidden = true; }, 5000);
+}
+
+// Trailing-edge coalescer: a burst of calls runs fn once, ms after the
+// last one, and never while a previous run is still in flight
+function coalesce(fn, ms = 250) {
+    let timer, running = false, pending = false;
+    const run = async () => {
+        if (running) {
+            pending = true;
+            return;
+        }
+        running = true;
+        try {
+            await fn();
+        } finally {
+            running = false;
+            if (pending) {
+                pending = false;
+                schedule();
+            }
+        }
+    };
+    const schedule = () => {
+        clearTimeout(timer);
+        timer = setTimeout(run, ms);
+    };
+    return schedule;
+}
+
+const refreshActivity = coalesce(() => fetchBootstrap({ stats: true, events: true }));
+
+subscribeEvents({
+    violation: (data) => showToast(data.message),
+    stats: (data) => renderStats(data),
+    events: (data) => renderEvents(data),
+    camera_fps: (data) => applyCameraFps(cameraNodes, data),
+    // Catch up on anything missed while the stream was reconnecting
+    connected: (data, reconnect) => {
+        if (reconnect) refreshActivity();
+    },
+});
+
+// Initial fetch, then a slow backstop poll for added or renamed cameras
+// (stats, events and frame rates arrive over SSE); each poll is scheduled
+// after the last one finishes so they never overlap
+const pollCameras = () => setTimeout(() => fetchBootstrap({ cameras: true }).then(pollCameras), 30000);
+if (initialStats) renderStats(initialStats);
+fetchBootstrap({ user: true, stats: !initialStats, cameras: true, events: true }, true).then(pollCameras);
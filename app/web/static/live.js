@@ -0,0 +1,91 @@
+const $ = id => document.getElementById(id);
+const els = {
+    datetime: $('datetime'),
+    cameraGrid: $('camera-grid'),
+    layoutSelect: $('layout-select'),
+};
+
+startClock(els.datetime);
+
+const cameraNodes = new Map();
+const cameraFeedTemplate = template(`
+    <div class="camera-feed">
+        <img class="w-full aspect-video object-cover bg-dark-900" loading="lazy" decoding="async">
+        <div class="absolute top-3 left-3 flex items-center gap-2">
+            <div class="status-dot"></div>
+            <span data-role="zone"></span>
+        </div>
+        <div class="absolute top-3 right-3 bg-black/50 px-2 py-1 rounded text-xs" data-role="fps"></div>
+        <div class="absolute bottom-0 left-0 right-0 bg-gradient-to-t from-black/80 to-transparent p-4">
+            <h3 class="font-semibold" data-role="name"></h3>
+            <p class="text-sm text-gray-400" data-role="short-id"></p>
+        </div>
+    </div>
+`);
+
+function createCameraFeed(cam) {
+    const root = cameraFeedTemplate.cloneNode(true);
+    root.dataset.cameraId = cam.id;
+    const img = root.querySelector('img');
+    observeStream(img, `/api/v1/stream/${cam.id}`);
+    root.querySelector('[data-role="short-id"]').textContent = `Camera ${cam.short_id}`;
+    return {
+        root,
+        img,
+        zone: root.querySelector('[data-role="zone"]'),
+        name: root.querySelector('[data-role="name"]'),
+        fps: root.querySelector('[data-role="fps"]'),
+        destroy: () => unobserveStream(img),
+    };
+}
+
+function updateCameraFeed(node, cam) {
+    node.img.alt = cam.name;
+    node.zone.className = `zone-tag zone-${cam.zone.toLowerCase()}`;
+    setText(node.zone, cam.zone);
+    setText(node.name, cam.name);
+    setText(node.fps, cam.fps_display);
+}
+
+let lastCamerasText = null;
+
+async function fetchCameras(priority = 'low', cache = 'default') {
+    try {
+        const response = await api('/api/v1/cameras', { priority, cache, signal: supersede('cameras') });
+        if (!response) return;
+        // Polls often return exactly what is already on screen
+        const text = await response.text();
+        if (text === lastCamerasText) return;
+        lastCamerasText = text;
+        const data = JSON.parse(text);
+
+        const grid = els.cameraGrid;
+        if (data.cameras.length === 0) {
+            clearNodes(cameraNodes);
+            emptyMessage(grid, 'No cameras configured', 'text-gray-500 col-span-2 text-center py-8');
+            return;
+        }
+        reconcile(grid, data.cameras, cameraNodes, createCameraFeed, updateCameraFeed);
+    } catch (e) {
+        if (!isAbort(e)) console.error('Failed to fetch cameras:', e);
+    }
+}
+
+// Option values are "<cols>x<rows>"
+els.layoutSelect.addEventListener('change', (e) => {
+    els.cameraGrid.style.setProperty('--cols', e.target.value.split('x')[0]);
+});
+
+subscribeEvents({
+    camera_fps: (data) => applyCameraFps(cameraNodes, data),
+    // Catch up on anything missed while the stream was reconnecting
+    connected: (data, reconnect) => {
+        if (reconnect) fetchCameras('low', 'no-cache');
+    },
+});
+
+// Frame rates arrive over SSE, so polling is only a slow backstop for
+// added or renamed cameras; chained rather than setInterval, so a slow
+// response delays the next poll instead of overlapping it
+const pollCameras = () => setTimeout(() => fetchCameras('low', 'no-cache').then(pollCameras), 30000);
+fetchCameras('high').then(pollCameras);
@@ -0,0 +1,96 @@
+const $ = id => document.getElementById(id);
+const els = {
+    form: $('login-form'),
+    authMode: $('auth-mode'),
+    registerFields: $('register-fields'),
+    formTitle: $('form-title'),
+    submitBtn: $('submit-btn'),
+    toggleText: $('toggle-text'),
+    email: $('email'),
+    password: $('password'),
+    errorMessage: $('error-message'),
+    orgName: $('org-name'),
+    fullName: $('full-name'),
+};
+
+const mode = els.authMode.value;
+if (mode === 'register') {
+    toggleMode();
+}
+
+function toggleMode() {
+    const authMode = els.authMode;
+    const registerFields = els.registerFields;
+    const formTitle = els.formTitle;
+    const submitBtn = els.submitBtn;
+    const toggleText = els.toggleText;
+
+    if (authMode.value === 'login') {
+        authMode.value = 'register';
+        registerFields.classList.remove('hidden');
+        formTitle.textContent = 'Create Account';
+        submitBtn.textContent = 'Create Account';
+        els.password.autocomplete = 'new-password';
+        toggleText.innerHTML = 'Already have an account? <a href="#" onclick="toggleMode()" class="text-accent hover:underline">Sign In</a>';
+    } else {
+        authMode.value = 'login';
+        registerFields.classList.add('hidden');
+        formTitle.textContent = 'Sign In';
+        submitBtn.textContent = 'Sign In';
+        els.password.autocomplete = 'current-password';
+        toggleText.innerHTML = 'Don\'t have an account? <a href="#" onclick="toggleMode()" class="text-accent hover:underline">Register</a>';
+    }
+}
+
+async function submitAuth() {
+    const authMode = els.authMode.value;
+    const email = els.email.value;
+    const password = els.password.value;
+    const errorDiv = els.errorMessage;
+
+    errorDiv.classList.add('hidden');
+
+    try {
+        let response;
+        if (authMode === 'login') {
+            response = await fetch('/api/v1/auth/login', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                credentials: 'same-origin',
+                body: JSON.stringify({ email, password })
+            });
+        } else {
+            const orgName = els.orgName.value;
+            const fullName = els.fullName.value;
+            response = await fetch('/api/v1/auth/register', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                credentials: 'same-origin',
+                body: JSON.stringify({
+                    organization_name: orgName,
+                    email,
+                    password,
+                    full_name: fullName
+                })
+            });
+        }
+
+        if (response.ok) {
+            window.location.href = '/dashboard';
+        } else {
+            const data = await response.json();
+            errorDiv.textContent = data.detail || 'Authentication failed';
+            errorDiv.classList.remove('hidden');
+        }
+    } catch (e) {
+        errorDiv.textContent = 'Connection error. Please try again.';
+        errorDiv.classList.remove('hidden');
+    }
+}
+
+// A real form submits on Enter from any field and lets password
+// managers fill and save credentials
+els.form.addEventListener('submit', (e) => {
+    e.preventDefault();
+    submitAuth();
+});
@@ -0,0 +1,188 @@
+// Helpers shared by the dashboard, live view and camera setup pages.
+// Loaded as a classic script ahead of each page's own script, so the
+// declarations below are visible there; cached across navigations.
+
+// Versioned URLs of the shared SSE worker and icon sprite, passed in by the page
+const SSE_WORKER_URL = document.currentScript.dataset.sseWorker;
+const ICON_SPRITE_URL = document.currentScript.dataset.iconSprite;
+
+// Same-origin fetches send the session cookie by default; only
+// requests with a JSON body need a Content-Type
+async function api(path, options = {}) {
+    const headers = options.body
+        ? { 'Content-Type': 'application/json', ...options.headers }
+        : options.headers;
+    const response = await fetch(path, { ...options, credentials: 'same-origin', headers });
+    if (response.status === 401) {
+        window.location.href = '/login';
+        return null;
+    }
+    return response;
+}
+
+// Mirrors CameraResponse.fps_display for rates pushed as camera_fps events
+function fpsDisplay(fps, inferFps) {
+    return `Stream ${fps.toFixed(1)} FPS | AI ${inferFps.toFixed(1)} FPS`;
+}
+
+// Patch one camera's FPS label in place from a camera_fps event
+function applyCameraFps(nodes, data) {
+    const node = nodes.get(data.camera_id);
+    if (node) setText(node.fps, fpsDisplay(data.fps, data.infer_fps));
+}
+
+// At most one outstanding request per key: starting another aborts the
+// previous one, so slow responses can't pile up or land out of order
+const inflight = {};
+
+function supersede(key) {
+    inflight[key]?.abort();
+    inflight[key] = new AbortController();
+    return inflight[key].signal;
+}
+
+const isAbort = (e) => e.name === 'AbortError';
+
+async function logout() {
+    await fetch('/api/v1/auth/logout', { method: 'POST', keepalive: true });
+    window.location.href = '/login';
+}
+
+// Parse static markup once; clone it for each item
+function template(html) {
+    const tpl = document.createElement('template');
+    tpl.innerHTML = html.trim();
+    return tpl.content.firstElementChild;
+}
+
+function setText(el, text) {
+    if (el.textContent !== text) el.textContent = text;
+}
+
+function emptyMessage(container, text, className) {
+    const p = document.createElement('p');
+    p.className = className;
+    p.textContent = text;
+    container.replaceChildren(p);
+}
+
+// Keyed reconciliation: reuse each item's node by id so existing
+// elements (and their MJPEG streams) survive refreshes
+function reconcile(container, items, nodes, create, update) {
+    const seen = new Set();
+    items.forEach((item, index) => {
+        let node = nodes.get(item.id);
+        if (!node) {
+            node = create(item);
+            nodes.set(item.id, node);
+        }
+        seen.add(item.id);
+        update(node, item);
+        const current = container.children[index];
+        if (current !== node.root) container.insertBefore(node.root, current || null);
+    });
+    for (const [id, node] of nodes) {
+        if (!seen.has(id)) {
+            node.destroy?.();
+            node.root.remove();
+            nodes.delete(id);
+        }
+    }
+    while (container.children.length > items.length) container.lastElementChild.remove();
+}
+
+function clearNodes(nodes) {
+    for (const node of nodes.values()) node.destroy?.();
+    nodes.clear();
+}
+
+// Only pull MJPEG frames for feeds that are on screen in a visible
+// tab; dropping the src aborts the stream request
+const visibleStreams = new Set();
+const streamObserver = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+        if (entry.isIntersecting) visibleStreams.add(entry.target);
+        else visibleStreams.delete(entry.target);
+        updateStream(entry.target);
+    }
+}, { rootMargin: '100px' });
+
+function updateStream(img) {
+    if (!document.hidden && visibleStreams.has(img)) {
+        if (img.getAttribute('src') !== img.dataset.stream) img.src = img.dataset.stream;
+    } else if (img.hasAttribute('src')) {
+        img.removeAttribute('src');
+    }
+}
+
+function observeStream(img, url) {
+    img.dataset.stream = url;
+    streamObserver.observe(img);
+}
+
+function unobserveStream(img) {
+    streamObserver.unobserve(img);
+    visibleStreams.delete(img);
+    img.removeAttribute('src');
+}
+
+document.addEventListener('visibilitychange', () => {
+    for (const img of visibleStreams) updateStream(img);
+});
+
+// Real-time events: one SSE connection shared by all tabs through a
+// SharedWorker, or a per-tab EventSource where that isn't supported
+function subscribeEvents(handlers) {
+    if (window.SharedWorker) {
+        const worker = new SharedWorker(SSE_WORKER_URL);
+        worker.port.onmessage = (e) => handlers[e.data.type]?.(e.data.data, e.data.reconnect);
+        worker.port.start();
+        addEventListener('pagehide', () => worker.port.postMessage('close'));
+        addEventListener('pageshow', (e) => {
+            if (e.persisted) worker.port.postMessage('open');
+        });
+        return;
+    }
+    // Same capped, jittered backoff as the shared worker
+    let connectedBefore = false;
+    let attempt = 0;
+    const open = () => {
+        const source = new EventSource('/api/v1/sse/events', { withCredentials: true });
+        source.onopen = () => {
+            attempt = 0;
+        };
+        source.onerror = (e) => {
+            if (e.data !== undefined) return;
+            source.close();
+            setTimeout(open, Math.min(30000, 500 * 2 ** attempt++) + Math.random() * 500);
+        };
+        for (const [type, handler] of Object.entries(handlers)) {
+            source.addEventListener(type, (e) => {
+                const reconnect = type === 'connected' && connectedBefore;
+                if (type === 'connected') connectedBefore = true;
+                handler(JSON.parse(e.data), reconnect);
+            });
+        }
+    };
+    open();
+}
+
+// Minute-resolution clock: one cached formatter, one wakeup per minute
+// while the tab is visible, resynced as soon as it is shown again
+const clockFormat = new Intl.DateTimeFormat('en-US', {
+    weekday: 'short', month: 'short', day: 'numeric',
+    hour: '2-digit', minute: '2-digit'
+});
+
+function startClock(el) {
+    let timer = 0;
+    const tick = () => {
+        clearTimeout(timer);
+        if (document.hidden) return;
+        const now = new Date();
+        setText(el, clockFormat.format(now));
+        timer = setTimeout(tick, 60000 - (now.getSeconds() * 1000 + now.getMilliseconds()));
+    };
+    document.addEventListener('visibilitychange', tick);
+    tick();
+}
@@ -0,0 +1,78 @@
+// Shares one /api/v1/sse/events connection between every open dashboard tab.
+// Each message is parsed once here and posted to all connected pages as
+// { type, data, reconnect }.
+const EVENT_TYPES = ['connected', 'violation', 'stats', 'events', 'camera_status', 'camera_fps', 'heartbeat', 'error'];
+
+const ports = new Set();
+let source = null;
+let connectedBefore = false;
+let retryTimer = 0;
+let attempt = 0;
+
+// Reconnect with capped exponential backoff plus jitter instead of the
+// browser's fixed retry, so a server restart isn't hit by every tab at once
+function retryDelay() {
+    return Math.min(30000, 500 * 2 ** attempt++) + Math.random() * 500;
+}
+
+function broadcast(message) {
+    for (const port of ports) port.postMessage(message);
+}
+
+function open() {
+    retryTimer = 0;
+    source = new EventSource('/api/v1/sse/events', { withCredentials: true });
+    source.onopen = () => {
+        attempt = 0;
+    };
+    source.onerror = (e) => {
+        // Named 'error' events from the server are handled below
+        if (e.data !== undefined) return;
+        source.close();
+        source = null;
+        retryTimer = setTimeout(open, retryDelay());
+    };
+    for (const type of EVENT_TYPES) {
+        source.addEventListener(type, (e) => {
+            let data = null;
+            try {
+                data = JSON.parse(e.data);
+            } catch (err) {
+                return;
+            }
+            const message = { type, data, reconnect: false };
+            if (type === 'connected') {
+                message.reconnect = connectedBefore;
+                connectedBefore = true;
+            }
+            broadcast(message);
+        });
+    }
+}
+
+function subscribe(port) {
+    ports.add(port);
+    if (!source && !retryTimer) open();
+}
+
+// Pages post 'close' on pagehide and 'open' when restored from bfcache
+onconnect = (e) => {
+    const port = e.ports[0];
+    port.onmessage = (msg) => {
+        if (msg.data === 'open') {
+            subscribe(port);
+        } else if (msg.data === 'close') {
+            ports.delete(port);
+            if (ports.size === 0) {
+                if (source) source.close();
+                source = null;
+                clearTimeout(retryTimer);
+                retryTimer = 0;
+                attempt = 0;
+                connectedBefore = false;
+            }
+        }
+    };
+    port.start();
+    subscribe(port);
+};
@@ -0,0 +1,74 @@
+// Service worker for dashboard API calls.
+//  - Concurrent identical GETs to /api/v1/* share one network request.
+//  - A few slow-changing GETs are answered from memory while being
+//    revalidated in the background (stale-while-revalidate). Requests made
+//    with cache: 'no-cache' or 'reload' skip that and refresh the entry.
+//  - Any API write clears the cache so edits show up immediately.
+const API_PREFIX = '/api/v1/';
+
+// Long-lived streams must never be shared or cached
+const PASSTHROUGH_PREFIXES = ['/api/v1/stream/', '/api/v1/sse/', '/api/v1/snapshot/'];
+
+// Maximum age (ms) at which a cached response may still be served
+const SWR_MAX_AGE = {
+    '/api/v1/auth/me': 60000,
+    '/api/v1/cameras': 30000,
+};
+
+const pending = new Map();
+const cache = new Map();
+
+self.addEventListener('install', () => self.skipWaiting());
+self.addEventListener('activate', (event) => event.waitUntil(self.clients.claim()));
+
+function fetchShared(request) {
+    const key = request.url;
+    let promise = pending.get(key);
+    if (!promise) {
+        promise = fetch(request).finally(() => pending.delete(key));
+        pending.set(key, promise);
+    }
+    return promise.then((response) => response.clone());
+}
+
+function revalidate(request) {
+    return fetchShared(request).then((response) => {
+        if (response.ok) {
+            cache.set(request.url, { response: response.clone(), time: Date.now() });
+        }
+        return response;
+    });
+}
+
+function staleWhileRevalidate(event, maxAge) {
+    const entry = cache.get(event.request.url);
+    const network = revalidate(event.request);
+    if (entry && Date.now() - entry.time < maxAge) {
+        event.waitUntil(network.catch(() => {}));
+        return Promise.resolve(entry.response.clone());
+    }
+    return network;
+}
+
+self.addEventListener('fetch', (event) => {
+    const url = new URL(event.request.url);
+    if (url.origin !== self.location.origin || !url.pathname.startsWith(API_PREFIX)) return;
+    if (PASSTHROUGH_PREFIXES.some((prefix) => url.pathname.startsWith(prefix))) return;
+
+    if (event.request.method !== 'GET') {
+        // Clear before and after, so a read racing the write can't re-cache old data
+        cache.clear();
+        event.respondWith(fetch(event.request).finally(() => cache.clear()));
+        return;
+    }
+
+    const maxAge = url.search ? undefined : SWR_MAX_AGE[url.pathname];
+    if (!maxAge) {
+        event.respondWith(fetchShared(event.request));
+    } else if (event.request.cache === 'no-cache' || event.request.cache === 'reload') {
+        // The page asked for current data (catch-up, polling); don't hand back a stale copy
+        event.respondWith(revalidate(event.request));
+    } else {
+        event.respondWith(staleWhileRevalidate(event, maxAge));
+    }
+});
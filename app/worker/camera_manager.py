@@ -1,7 +1,7 @@
 """Multi-camera orchestration with database-backed configuration."""
 
 import asyncio
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from uuid import UUID
 from dataclasses import dataclass, field
 from enum import Enum
@@ -63,6 +63,9 @@ class CameraContext:
     infer_task: Optional[asyncio.Task] = None
     fps_ema: float = 0.0
     infer_fps_ema: float = 0.0
+    # Last (fps, infer_fps) pushed to dashboards, rounded as displayed
+    pushed_fps: Optional[Tuple[float, float]] = None
+    last_fps_push: float = 0.0
     task: Optional[asyncio.Task] = None
 
 
@@ -291,7 +294,7 @@ class CameraManager:
 
         # Update database status
         await self._update_camera_status(
-            camera_id, CameraStatus.offline, "Stopped"
+            context, CameraStatus.offline, "Stopped"
         )
 
     async def _process_camera(self, context: CameraContext) -> None:
@@ -302,7 +305,7 @@ class CameraManager:
             # Connect to source
             context.state = CameraState.CONNECTING
             await self._update_camera_status(
-                camera_id, CameraStatus.connecting, None
+                context, CameraStatus.connecting, None
             )
 
             cap, error = await self._connect_camera(context)
@@ -311,14 +314,14 @@ class CameraManager:
                 context.state = CameraState.ERROR
                 context.error_message = error
                 await self._update_camera_status(
-                    camera_id, CameraStatus.error, error
+                    context, CameraStatus.error, error
                 )
                 return
 
             context.cap = cap
             context.state = CameraState.STREAMING
             await self._update_camera_status(
-                camera_id, CameraStatus.online, None
+                context, CameraStatus.online, None
             )
 
             # Initialize inference timing so first inference can calculate EMA
@@ -369,7 +372,7 @@ class CameraManager:
                         context.state = CameraState.ERROR
                         context.error_message = error
                         await self._update_camera_status(
-                            camera_id, CameraStatus.error, error
+                            context, CameraStatus.error, error
                         )
                         break
 
@@ -487,13 +490,15 @@ class CameraManager:
                     stream_frame = downscale_for_stream(annotated)
 
                     # Publish frame
+                    infer_fps = context.infer_fps_ema if context.inference_enabled else 0.0
                     await self.frame_processor.publish_frame(
                         camera_id=str(camera_id),
                         frame=stream_frame,
                         fps=fps,
                         detection_count=detection_count,
-                        infer_fps=context.infer_fps_ema if context.inference_enabled else 0.0,
+                        infer_fps=infer_fps,
                     )
+                    await self._push_camera_fps(context, fps, infer_fps, loop_start)
 
                 context.frames_processed += 1
 
@@ -510,7 +515,7 @@ class CameraManager:
             context.state = CameraState.ERROR
             context.error_message = str(e)
             await self._update_camera_status(
-                camera_id, CameraStatus.error, str(e)
+                context, CameraStatus.error, str(e)
             )
         finally:
             if context.cap:
@@ -626,17 +631,56 @@ class CameraManager:
 
     async def _update_camera_status(
         self,
-        camera_id: UUID,
+        context: CameraContext,
         status: CameraStatus,
         error_message: Optional[str],
     ) -> None:
-        """Update camera status in database."""
+        """Update camera status in database and push it to dashboards."""
         try:
             async with async_session_factory() as session:
                 repo = GlobalCameraRepository(session)
-                await repo.update_status(camera_id, status, error_message)
+                await repo.update_status(context.camera_id, status, error_message)
         except Exception as e:
             print(f"[CAMERA_MANAGER] Failed to update status: {e}")
+            return
+
+        if self.event_publisher:
+            try:
+                await self.event_publisher.publish_camera_status(
+                    str(context.organization_id),
+                    str(context.camera_id),
+                    status.value,
+                    error_message,
+                )
+            except Exception as e:
+                print(f"[CAMERA_MANAGER] Failed to publish status: {e}")
+
+    async def _push_camera_fps(
+        self,
+        context: CameraContext,
+        fps: float,
+        infer_fps: float,
+        now: float,
+    ) -> None:
+        """Push frame rates to dashboards when the displayed value changes."""
+        if not self.event_publisher:
+            return
+        if now - context.last_fps_push < config.CAMERA_FPS_PUSH_INTERVAL:
+            return
+        rounded = (round(fps, 1), round(infer_fps, 1))
+        if rounded == context.pushed_fps:
+            return
+
+        context.pushed_fps = rounded
+        context.last_fps_push = now
+        try:
+            await self.event_publisher.publish_camera_fps(
+                str(context.organization_id),
+                str(context.camera_id),
+                *rounded,
+            )
+        except Exception as e:
+            print(f"[CAMERA_MANAGER] Failed to publish fps: {e}")
 
     async def _refresh_loop(self) -> None:
         """Periodically refresh camera list."""
@@ -28,6 +28,10 @@ class WorkerConfig:
     STREAM_MAX_WIDTH: int = int(os.getenv("STREAM_MAX_WIDTH", "640"))
     STREAM_MAX_HEIGHT: int = int(os.getenv("STREAM_MAX_HEIGHT", "480"))
 
+    # Minimum seconds between pushed FPS updates per camera (sent only when
+    # the displayed value changes)
+    CAMERA_FPS_PUSH_INTERVAL: float = float(os.getenv("CAMERA_FPS_PUSH_INTERVAL", "2.0"))
+
     # Deduplication
     COOLDOWN_SECONDS: int = int(os.getenv("COOLDOWN_SECONDS", "30"))
 
@@ -0,0 +1,13 @@
+/** Tailwind build for the dashboard templates in app/web/ and the pages in app/main.py. */
+module.exports = {
+  content: ['./app/web/**/*.{py,html,js}', './app/main.py'],
+  theme: {
+    extend: {
+      colors: {
+        dark: { 900: '#0f0f1a', 800: '#1a1a2e', 700: '#252542', 600: '#2f2f4a' },
+        accent: '#00d4aa',
+      },
+    },
+  },
+  plugins: [],
+};